@@ -93,6 +93,17 @@ class Collider(sge.dsp.Object):
     nonstick_bottom = False
     slope_acceleration = 0
 
+    _physics_state = None
+
+    def _physics_sync(self):
+        # Return this collider's physics state, creating it if necessary
+        # and refreshing it from the object's current values.
+        if self._physics_state is None:
+            self._physics_state = _ColliderState(self)
+        else:
+            self._physics_state.refresh()
+        return self._physics_state
+
     def move_x(self, move, absolute=False, do_events=True, exclude_events=()):
         """
         Move the object horizontally, handling physics.
@@ -111,16 +122,17 @@ class Collider(sge.dsp.Object):
           which should not cause collision events to be executed if
           collided with.
         """
+        st = self._physics_sync()
         exclude_events = set(exclude_events)
         exclude_events.add(None)
         sticky = False
         move_mult = 1
         old_x = self.x
         old_y = self.y
-        old_bbox_left = self.bbox_left
-        old_bbox_right = self.bbox_right
-        old_bbox_top = self.bbox_top
-        old_bbox_bottom = self.bbox_bottom
+        old_bbox_left = st.bbox_left
+        old_bbox_right = st.bbox_right
+        old_bbox_top = st.bbox_top
+        old_bbox_bottom = st.bbox_bottom
         rold_bbox_top = round(old_bbox_top, NDIG)
         rold_bbox_bottom = round(old_bbox_bottom, NDIG)
         on_floor = None
@@ -155,11 +167,11 @@ class Collider(sge.dsp.Object):
                 return on_ceil
 
         if move > 0:
-            if not self.nonstick_bottom:
-                bbb = round(self.bbox_bottom, NDIG)
+            if not st.nonstick_bottom:
+                bbb = round(st.bbox_bottom, NDIG)
                 for slope in self.collision(SlopeTopRight, y=(self.y + 1)):
                     if slope.xsticky_top:
-                        y = round(slope.get_slope_y(self.bbox_left), NDIG)
+                        y = round(slope.get_slope_y(st.bbox_left), NDIG)
                         if bbb == y:
                             sticky = 1
                             if not absolute:
@@ -167,15 +179,15 @@ class Collider(sge.dsp.Object):
                                                slope.bbox_height)
                                 move_mult = slope.bbox_width / h
                             break
-                        elif (self.bbox_left <= slope.bbox_left and
+                        elif (st.bbox_left <= slope.bbox_left and
                               not self.collision(slope)):
                             sticky = 1
                             break
-            if not sticky and not self.nonstick_top:
-                bbt = round(self.bbox_top, NDIG)
+            if not sticky and not st.nonstick_top:
+                bbt = round(st.bbox_top, NDIG)
                 for slope in self.collision(SlopeBottomRight, y=(self.y - 1)):
                     if slope.xsticky_bottom:
-                        y = round(slope.get_slope_y(self.bbox_left), NDIG)
+                        y = round(slope.get_slope_y(st.bbox_left), NDIG)
                         if bbt == y:
                             sticky = 2
                             if not absolute:
@@ -183,21 +195,22 @@ class Collider(sge.dsp.Object):
                                                slope.bbox_height)
                                 move_mult = slope.bbox_width / h
                             break
-                        elif (self.bbox_left <= slope.bbox_left and
+                        elif (st.bbox_left <= slope.bbox_left and
                               not self.collision(slope)):
                             sticky = 2
                             break
 
             self.x += move * move_mult
+            st.update()
 
             stopper = None
 
             slopes = self.collision(SlopeTopLeft)
-            def key(s, self=self): return s.get_slope_x(self.bbox_bottom)
+            def key(s, st=st): return s.get_slope_x(st.bbox_bottom)
             slopes.sort(key=key)
             for other in slopes:
-                y = other.get_slope_y(self.bbox_right)
-                if self.bbox_bottom > y:
+                y = other.get_slope_y(st.bbox_right)
+                if st.bbox_bottom > y:
                     oy = round(other.get_slope_y(old_bbox_right), NDIG)
                     if rold_bbox_bottom <= oy:
                         if not absolute:
@@ -205,15 +218,17 @@ class Collider(sge.dsp.Object):
                             m = other.bbox_width / h
                             if m < move_mult:
                                 self.x -= move * (move_mult - m)
+                                st.update()
                                 move_mult = m
-                                y = other.get_slope_y(self.bbox_right)
-                        self.move_y(y - self.bbox_bottom, do_events=do_events,
+                                y = other.get_slope_y(st.bbox_right)
+                        self.move_y(y - st.bbox_bottom, do_events=do_events,
                                     exclude_events=exclude_events)
-                        x = other.get_slope_x(self.bbox_bottom)
-                        diff = self.bbox_right - x
+                        x = other.get_slope_x(st.bbox_bottom)
+                        diff = st.bbox_right - x
                         if diff > 0:
                             self.bbox_right = x
-                            if self.bbox_bottom == y:
+                            st.update()
+                            if st.bbox_bottom == y:
                                 self.move_x(diff, do_events=do_events,
                                             exclude_events=exclude_events)
 
@@ -221,15 +236,16 @@ class Collider(sge.dsp.Object):
                         if on_floor:
                             stopper = other
                     elif not self.collision(other, x=old_x):
-                        self.bbox_right = min(self.bbox_right, other.bbox_left)
+                        self.bbox_right = min(st.bbox_right, other.bbox_left)
+                        st.update()
                         stopper = other
 
             slopes = self.collision(SlopeBottomLeft)
-            def key(s, self=self): return s.get_slope_x(self.bbox_top)
+            def key(s, st=st): return s.get_slope_x(st.bbox_top)
             slopes.sort(key=key)
             for other in slopes:
-                y = other.get_slope_y(self.bbox_right)
-                if self.bbox_top < y:
+                y = other.get_slope_y(st.bbox_right)
+                if st.bbox_top < y:
                     oy = round(other.get_slope_y(old_bbox_right), NDIG)
                     if rold_bbox_top >= oy:
                         if not absolute:
@@ -237,15 +253,17 @@ class Collider(sge.dsp.Object):
                             m = other.bbox_width / h
                             if m < move_mult:
                                 self.x -= move * (move_mult - m)
+                                st.update()
                                 move_mult = m
-                                y = other.get_slope_y(self.bbox_right)
-                        self.move_y(y - self.bbox_top, do_events=do_events,
+                                y = other.get_slope_y(st.bbox_right)
+                        self.move_y(y - st.bbox_top, do_events=do_events,
                                     exclude_events=exclude_events)
-                        x = other.get_slope_x(self.bbox_top)
-                        diff = self.bbox_right - x
+                        x = other.get_slope_x(st.bbox_top)
+                        diff = st.bbox_right - x
                         if diff > 0:
                             self.bbox_right = x
-                            if self.bbox_top == y:
+                            st.update()
+                            if st.bbox_top == y:
                                 self.move_x(diff, do_events=do_events,
                                             exclude_events=exclude_events)
 
@@ -253,25 +271,28 @@ class Collider(sge.dsp.Object):
                         if on_ceil:
                             stopper = other
                     elif not self.collision(other, x=old_x):
-                        self.bbox_right = min(self.bbox_right, other.bbox_left)
+                        self.bbox_right = min(st.bbox_right, other.bbox_left)
+                        st.update()
                         stopper = other
 
             for other in self.collision(SolidLeft):
                 if not self.collision(other, x=old_x):
-                    self.bbox_right = min(self.bbox_right, other.bbox_left)
+                    self.bbox_right = min(st.bbox_right, other.bbox_left)
+                    st.update()
                     stopper = other
 
             if do_events and stopper not in exclude_events:
                 move_loss = max(0, abs(move) - abs(self.x - old_x))
                 self.event_physics_collision_right(stopper, move_loss)
                 stopper.event_physics_collision_left(self, 0)
+                st.refresh()
                 
         elif move < 0:
-            if not self.nonstick_bottom:
-                bbb = round(self.bbox_bottom, NDIG)
+            if not st.nonstick_bottom:
+                bbb = round(st.bbox_bottom, NDIG)
                 for slope in self.collision(SlopeTopLeft, y=(self.y + 1)):
                     if slope.xsticky_top:
-                        y = round(slope.get_slope_y(self.bbox_right), NDIG)
+                        y = round(slope.get_slope_y(st.bbox_right), NDIG)
                         if bbb == y:
                             sticky = 1
                             if not absolute:
@@ -279,15 +300,15 @@ class Collider(sge.dsp.Object):
                                                slope.bbox_height)
                                 move_mult = slope.bbox_width / h
                             break
-                        elif (self.bbox_right >= slope.bbox_right and
+                        elif (st.bbox_right >= slope.bbox_right and
                               not self.collision(slope)):
                             sticky = 1
                             break
-            if not sticky and not self.nonstick_top:
-                bbt = round(self.bbox_top, NDIG)
+            if not sticky and not st.nonstick_top:
+                bbt = round(st.bbox_top, NDIG)
                 for slope in self.collision(SlopeBottomLeft, y=(self.y - 1)):
                     if slope.xsticky_bottom:
-                        y = round(slope.get_slope_y(self.bbox_right), NDIG)
+                        y = round(slope.get_slope_y(st.bbox_right), NDIG)
                         if bbt == y:
                             sticky = 2
                             if not absolute:
@@ -295,21 +316,22 @@ class Collider(sge.dsp.Object):
                                                slope.bbox_height)
                                 move_mult = slope.bbox_width / h
                             break
-                        elif (self.bbox_right >= slope.bbox_right and
+                        elif (st.bbox_right >= slope.bbox_right and
                               not self.collision(slope)):
                             sticky = 2
                             break
 
             self.x += move * move_mult
+            st.update()
 
             stopper = None
 
             slopes = self.collision(SlopeTopRight)
-            def key(s, self=self): return -s.get_slope_x(self.bbox_bottom)
+            def key(s, st=st): return -s.get_slope_x(st.bbox_bottom)
             slopes.sort(key=key)
             for other in slopes:
-                y = other.get_slope_y(self.bbox_left)
-                if self.bbox_bottom > y:
+                y = other.get_slope_y(st.bbox_left)
+                if st.bbox_bottom > y:
                     oy = round(other.get_slope_y(old_bbox_left), NDIG)
                     if rold_bbox_bottom <= oy:
                         if not absolute:
@@ -317,15 +339,17 @@ class Collider(sge.dsp.Object):
                             m = other.bbox_width / h
                             if m < move_mult:
                                 self.x -= move * (move_mult - m)
+                                st.update()
                                 move_mult = m
-                                y = other.get_slope_y(self.bbox_left)
-                        self.move_y(y - self.bbox_bottom, do_events=do_events,
+                                y = other.get_slope_y(st.bbox_left)
+                        self.move_y(y - st.bbox_bottom, do_events=do_events,
                                     exclude_events=exclude_events)
-                        x = other.get_slope_x(self.bbox_bottom)
-                        diff = self.bbox_left - x
+                        x = other.get_slope_x(st.bbox_bottom)
+                        diff = st.bbox_left - x
                         if diff < 0:
                             self.bbox_left = x
-                            if self.bbox_bottom == y:
+                            st.update()
+                            if st.bbox_bottom == y:
                                 self.move_x(diff, do_events=do_events,
                                             exclude_events=exclude_events)
 
@@ -333,15 +357,16 @@ class Collider(sge.dsp.Object):
                         if on_floor:
                             stopper = other
                     elif not self.collision(other, x=old_x):
-                        self.bbox_left = max(self.bbox_left, other.bbox_right)
+                        self.bbox_left = max(st.bbox_left, other.bbox_right)
+                        st.update()
                         stopper = other
 
             slopes = self.collision(SlopeBottomRight)
-            def key(s, self=self): return -s.get_slope_x(self.bbox_top)
+            def key(s, st=st): return -s.get_slope_x(st.bbox_top)
             slopes.sort(key=key)
             for other in slopes:
-                y = other.get_slope_y(self.bbox_left)
-                if self.bbox_top < y:
+                y = other.get_slope_y(st.bbox_left)
+                if st.bbox_top < y:
                     oy = round(other.get_slope_y(old_bbox_left), NDIG)
                     if rold_bbox_top >= oy:
                         if not absolute:
@@ -349,15 +374,17 @@ class Collider(sge.dsp.Object):
                             m = other.bbox_width / h
                             if m < move_mult:
                                 self.x -= move * (move_mult - m)
+                                st.update()
                                 move_mult = m
-                                y = other.get_slope_y(self.bbox_left)
-                        self.move_y(y - self.bbox_top, do_events=do_events,
+                                y = other.get_slope_y(st.bbox_left)
+                        self.move_y(y - st.bbox_top, do_events=do_events,
                                     exclude_events=exclude_events)
-                        x = other.get_slope_x(self.bbox_top)
-                        diff = self.bbox_left - x
+                        x = other.get_slope_x(st.bbox_top)
+                        diff = st.bbox_left - x
                         if diff < 0:
                             self.bbox_left = x
-                            if self.bbox_top == y:
+                            st.update()
+                            if st.bbox_top == y:
                                 self.move_x(diff, do_events=do_events,
                                             exclude_events=exclude_events)
 
@@ -365,18 +392,21 @@ class Collider(sge.dsp.Object):
                         if on_ceil:
                             stopper = other
                     elif not self.collision(other, x=old_x):
-                        self.bbox_left = max(self.bbox_left, other.bbox_right)
+                        self.bbox_left = max(st.bbox_left, other.bbox_right)
+                        st.update()
                         stopper = other
 
             for other in self.collision(SolidRight):
                 if not self.collision(other, x=old_x):
-                    self.bbox_left = max(self.bbox_left, other.bbox_right)
+                    self.bbox_left = max(st.bbox_left, other.bbox_right)
+                    st.update()
                     stopper = other
 
             if do_events and stopper not in exclude_events:
                 move_loss = max(0, abs(move) - abs(self.x - old_x))
                 self.event_physics_collision_left(stopper, move_loss)
                 stopper.event_physics_collision_right(self, 0)
+                st.refresh()
 
         # Engage stickiness (same whether moving left or right)
         # 1 = sticking to the floor
@@ -387,59 +417,61 @@ class Collider(sge.dsp.Object):
                 new_bbox_bottom = None
                 others = (
                     sge.game.current_room.get_objects_at(
-                        self.bbox_left, self.bbox_top, self.bbox_width,
-                        (sge.game.current_room.height - self.bbox_top +
+                        st.bbox_left, st.bbox_top, st.bbox_width,
+                        (sge.game.current_room.height - st.bbox_top +
                          sge.game.current_room.object_area_height)) |
                     sge.game.current_room.object_area_void)
                 for other in others:
-                    if (other.bbox_left >= self.bbox_right or
-                            other.bbox_right <= self.bbox_left):
+                    if (other.bbox_left >= st.bbox_right or
+                            other.bbox_right <= st.bbox_left):
                         continue
 
                     if isinstance(other, SolidTop):
                         y = other.bbox_top
                     elif isinstance(other, SlopeTopLeft):
-                        y = other.get_slope_y(self.bbox_right)
+                        y = other.get_slope_y(st.bbox_right)
                     elif isinstance(other, SlopeTopRight):
-                        y = other.get_slope_y(self.bbox_left)
+                        y = other.get_slope_y(st.bbox_left)
                     else:
                         continue
 
-                    if (y >= self.bbox_bottom and
+                    if (y >= st.bbox_bottom and
                             (new_bbox_bottom is None or
                              y < new_bbox_bottom)):
                         new_bbox_bottom = y
 
                 if new_bbox_bottom is not None:
                     self.bbox_bottom = new_bbox_bottom
+                    st.update()
         elif sticky == 2:
             if (not self.get_top_touching_slope() and
                     not self.get_top_touching_wall()):
                 new_bbox_top = None
                 others = (
                     sge.game.current_room.get_objects_at(
-                        self.bbox_left, 0, self.bbox_width, self.bbox_bottom) |
+                        st.bbox_left, 0, st.bbox_width, st.bbox_bottom) |
                     sge.game.current_room.object_area_void)
                 for other in others:
-                    if (other.bbox_left >= self.bbox_right or
-                            other.bbox_right <= self.bbox_left):
+                    if (other.bbox_left >= st.bbox_right or
+                            other.bbox_right <= st.bbox_left):
                         continue
 
                     if isinstance(other, SolidBottom):
                         y = other.bbox_bottom
                     elif isinstance(other, SlopeBottomLeft):
-                        y = other.get_slope_y(self.bbox_right)
+                        y = other.get_slope_y(st.bbox_right)
                     elif isinstance(other, SlopeBottomRight):
-                        y = other.get_slope_y(self.bbox_left)
+                        y = other.get_slope_y(st.bbox_left)
                     else:
                         continue
 
-                    if y <= self.bbox_top and (new_bbox_top is None or
+                    if y <= st.bbox_top and (new_bbox_top is None or
                                                y > new_bbox_top):
                         new_bbox_top = y
 
                 if new_bbox_top is not None:
                     self.bbox_top = new_bbox_top
+                    st.update()
 
     def move_y(self, move, absolute=False, do_events=True, exclude_events=()):
         """
@@ -459,18 +491,19 @@ class Collider(sge.dsp.Object):
           which should not cause collision events to be executed if
           collided with.
         """
+        st = self._physics_sync()
         exclude_events = set(exclude_events)
         exclude_events.add(None)
         sticky = False
         move_mult = 1
         old_x = self.x
         old_y = self.y
-        old_bbox_left = self.bbox_left
-        old_bbox_right = self.bbox_right
+        old_bbox_left = st.bbox_left
+        old_bbox_right = st.bbox_right
         rold_bbox_left = round(old_bbox_left, NDIG)
         rold_bbox_right = round(old_bbox_right, NDIG)
-        old_bbox_top = self.bbox_top
-        old_bbox_bottom = self.bbox_bottom
+        old_bbox_top = st.bbox_top
+        old_bbox_bottom = st.bbox_bottom
         on_right = None
         on_left = None
 
@@ -503,11 +536,11 @@ class Collider(sge.dsp.Object):
                 return on_left
 
         if move > 0:
-            if not self.nonstick_right:
-                bbr = round(self.bbox_right, NDIG)
+            if not st.nonstick_right:
+                bbr = round(st.bbox_right, NDIG)
                 for slope in self.collision(SlopeBottomLeft, x=(self.x + 1)):
                     if slope.ysticky_left:
-                        x = round(slope.get_slope_x(self.bbox_top), NDIG)
+                        x = round(slope.get_slope_x(st.bbox_top), NDIG)
                         if bbr == x:
                             sticky = 1
                             if not absolute:
@@ -515,15 +548,15 @@ class Collider(sge.dsp.Object):
                                                slope.bbox_height)
                                 move_mult = slope.bbox_height / h
                             break
-                        elif (self.bbox_top <= slope.bbox_top and
+                        elif (st.bbox_top <= slope.bbox_top and
                               not self.collision(slope)):
                             sticky = 1
                             break
-            if not sticky and not self.nonstick_left:
-                bbl = round(self.bbox_left, NDIG)
+            if not sticky and not st.nonstick_left:
+                bbl = round(st.bbox_left, NDIG)
                 for slope in self.collision(SlopeBottomRight, x=(self.x - 1)):
                     if slope.ysticky_right:
-                        x = round(slope.get_slope_x(self.bbox_top), NDIG)
+                        x = round(slope.get_slope_x(st.bbox_top), NDIG)
                         if bbl == x:
                             sticky = 2
                             if not absolute:
@@ -531,21 +564,22 @@ class Collider(sge.dsp.Object):
                                                slope.bbox_height)
                                 move_mult = slope.bbox_height / h
                             break
-                        elif (self.bbox_top <= slope.bbox_top and
+                        elif (st.bbox_top <= slope.bbox_top and
                               not self.collision(slope)):
                             sticky = 2
                             break
 
             self.y += move * move_mult
+            st.update()
 
             stopper = None
 
             slopes = self.collision(SlopeTopLeft)
-            def key(s, self=self): return s.get_slope_y(self.bbox_right)
+            def key(s, st=st): return s.get_slope_y(st.bbox_right)
             slopes.sort(key=key)
             for other in slopes:
-                x = other.get_slope_x(self.bbox_bottom)
-                if self.bbox_right > x:
+                x = other.get_slope_x(st.bbox_bottom)
+                if st.bbox_right > x:
                     ox = round(other.get_slope_x(old_bbox_bottom), NDIG)
                     if rold_bbox_right <= ox:
                         if not absolute:
@@ -553,15 +587,17 @@ class Collider(sge.dsp.Object):
                             m = other.bbox_height / h
                             if m < move_mult:
                                 self.y -= move * (move_mult - m)
+                                st.update()
                                 move_mult = m
-                                x = other.get_slope_x(self.bbox_bottom)
-                        self.move_x(x - self.bbox_right, do_events=do_events,
+                                x = other.get_slope_x(st.bbox_bottom)
+                        self.move_x(x - st.bbox_right, do_events=do_events,
                                     exclude_events=exclude_events)
-                        y = other.get_slope_y(self.bbox_right)
-                        diff = self.bbox_bottom - y
+                        y = other.get_slope_y(st.bbox_right)
+                        diff = st.bbox_bottom - y
                         if diff > 0:
                             self.bbox_bottom = y
-                            if self.bbox_right == x:
+                            st.update()
+                            if st.bbox_right == x:
                                 self.move_y(diff, do_events=do_events,
                                             exclude_events=exclude_events)
 
@@ -569,16 +605,16 @@ class Collider(sge.dsp.Object):
                         if on_right:
                             stopper = other
                     elif not self.collision(other, y=old_y):
-                        self.bbox_bottom = min(self.bbox_bottom,
-                                               other.bbox_top)
+                        self.bbox_bottom = min(st.bbox_bottom, other.bbox_top)
+                        st.update()
                         stopper = other
 
             slopes = self.collision(SlopeTopRight)
-            def key(s, self=self): return s.get_slope_y(self.bbox_left)
+            def key(s, st=st): return s.get_slope_y(st.bbox_left)
             slopes.sort(key=key)
             for other in slopes:
-                x = other.get_slope_x(self.bbox_bottom)
-                if self.bbox_left < x:
+                x = other.get_slope_x(st.bbox_bottom)
+                if st.bbox_left < x:
                     ox = round(other.get_slope_x(old_bbox_bottom), NDIG)
                     if rold_bbox_left >= ox:
                         if not absolute:
@@ -586,15 +622,17 @@ class Collider(sge.dsp.Object):
                             m = other.bbox_height / h
                             if m < move_mult:
                                 self.y -= move * (move_mult - m)
+                                st.update()
                                 move_mult = m
-                                x = other.get_slope_x(self.bbox_bottom)
-                        self.move_x(x - self.bbox_left, do_events=do_events,
+                                x = other.get_slope_x(st.bbox_bottom)
+                        self.move_x(x - st.bbox_left, do_events=do_events,
                                     exclude_events=exclude_events)
-                        y = other.get_slope_y(self.bbox_left)
-                        diff = self.bbox_bottom - y
+                        y = other.get_slope_y(st.bbox_left)
+                        diff = st.bbox_bottom - y
                         if diff > 0:
                             self.bbox_bottom = y
-                            if self.bbox_left == x:
+                            st.update()
+                            if st.bbox_left == x:
                                 self.move_y(diff, do_events=do_events,
                                             exclude_events=exclude_events)
 
@@ -602,26 +640,28 @@ class Collider(sge.dsp.Object):
                         if on_left:
                             stopper = other
                     elif not self.collision(other, y=old_y):
-                        self.bbox_bottom = min(self.bbox_bottom,
-                                               other.bbox_top)
+                        self.bbox_bottom = min(st.bbox_bottom, other.bbox_top)
+                        st.update()
                         stopper = other
 
             for other in self.collision(SolidTop):
                 if not self.collision(other, y=old_y):
-                    self.bbox_bottom = min(self.bbox_bottom, other.bbox_top)
+                    self.bbox_bottom = min(st.bbox_bottom, other.bbox_top)
+                    st.update()
                     stopper = other
 
             if do_events and stopper not in exclude_events:
                 move_loss = max(0, abs(move) - abs(self.y - old_y))
                 self.event_physics_collision_bottom(stopper, move_loss)
                 stopper.event_physics_collision_top(self, 0)
+                st.refresh()
                 
         elif move < 0:
-            if not self.nonstick_right:
-                bbr = round(self.bbox_right, NDIG)
+            if not st.nonstick_right:
+                bbr = round(st.bbox_right, NDIG)
                 for slope in self.collision(SlopeTopLeft, x=(self.x + 1)):
                     if slope.ysticky_left:
-                        x = round(slope.get_slope_x(self.bbox_bottom), NDIG)
+                        x = round(slope.get_slope_x(st.bbox_bottom), NDIG)
                         if bbr == x:
                             sticky = 1
                             if not absolute:
@@ -629,15 +669,15 @@ class Collider(sge.dsp.Object):
                                                slope.bbox_height)
                                 move_mult = slope.bbox_height / h
                             break
-                        elif (self.bbox_bottom >= slope.bbox_bottom and
+                        elif (st.bbox_bottom >= slope.bbox_bottom and
                               not self.collision(slope)):
                             sticky = 1
                             break
-            if not sticky and not self.nonstick_left:
-                bbl = round(self.bbox_left, NDIG)
+            if not sticky and not st.nonstick_left:
+                bbl = round(st.bbox_left, NDIG)
                 for slope in self.collision(SlopeTopRight, x=(self.x - 1)):
                     if slope.ysticky_right:
-                        x = round(slope.get_slope_x(self.bbox_bottom), NDIG)
+                        x = round(slope.get_slope_x(st.bbox_bottom), NDIG)
                         if bbl == x:
                             sticky = 2
                             if not absolute:
@@ -645,21 +685,22 @@ class Collider(sge.dsp.Object):
                                                slope.bbox_height)
                                 move_mult = slope.bbox_height / h
                             break
-                        elif (self.bbox_bottom >= slope.bbox_bottom and
+                        elif (st.bbox_bottom >= slope.bbox_bottom and
                               not self.collision(slope)):
                             sticky = 2
                             break
 
             self.y += move * move_mult
+            st.update()
 
             stopper = None
 
             slopes = self.collision(SlopeBottomLeft)
-            def key(s, self=self): return -s.get_slope_y(self.bbox_right)
+            def key(s, st=st): return -s.get_slope_y(st.bbox_right)
             slopes.sort(key=key)
             for other in slopes:
-                x = other.get_slope_x(self.bbox_top)
-                if self.bbox_right > x:
+                x = other.get_slope_x(st.bbox_top)
+                if st.bbox_right > x:
                     ox = round(other.get_slope_x(old_bbox_top), NDIG)
                     if rold_bbox_right <= ox:
                         if not absolute:
@@ -667,15 +708,17 @@ class Collider(sge.dsp.Object):
                             m = other.bbox_height / h
                             if m < move_mult:
                                 self.y -= move * (move_mult - m)
+                                st.update()
                                 move_mult = m
-                                x = other.get_slope_x(self.bbox_top)
-                        self.move_x(x - self.bbox_right, do_events=do_events,
+                                x = other.get_slope_x(st.bbox_top)
+                        self.move_x(x - st.bbox_right, do_events=do_events,
                                     exclude_events=exclude_events)
-                        y = other.get_slope_y(self.bbox_right)
-                        diff = self.bbox_top - y
+                        y = other.get_slope_y(st.bbox_right)
+                        diff = st.bbox_top - y
                         if diff < 0:
                             self.bbox_top = y
-                            if self.bbox_right == x:
+                            st.update()
+                            if st.bbox_right == x:
                                 self.move_y(diff, do_events=do_events,
                                             exclude_events=exclude_events)
 
@@ -683,15 +726,16 @@ class Collider(sge.dsp.Object):
                         if on_right:
                             stopper = other
                     elif not self.collision(other, y=old_y):
-                        self.bbox_top = max(self.bbox_top, other.bbox_bottom)
+                        self.bbox_top = max(st.bbox_top, other.bbox_bottom)
+                        st.update()
                         stopper = other
 
             slopes = self.collision(SlopeBottomRight)
-            def key(s, self=self): return -s.get_slope_y(self.bbox_left)
+            def key(s, st=st): return -s.get_slope_y(st.bbox_left)
             slopes.sort(key=key)
             for other in self.collision(SlopeBottomRight):
-                x = other.get_slope_x(self.bbox_top)
-                if self.bbox_left < x:
+                x = other.get_slope_x(st.bbox_top)
+                if st.bbox_left < x:
                     ox = round(other.get_slope_x(old_bbox_top), NDIG)
                     if rold_bbox_left >= ox:
                         if not absolute:
@@ -699,15 +743,17 @@ class Collider(sge.dsp.Object):
                             m = other.bbox_height / h
                             if m < move_mult:
                                 self.y -= move * (move_mult - m)
+                                st.update()
                                 move_mult = m
-                                x = other.get_slope_x(self.bbox_top)
-                        self.move_x(x - self.bbox_left, do_events=do_events,
+                                x = other.get_slope_x(st.bbox_top)
+                        self.move_x(x - st.bbox_left, do_events=do_events,
                                     exclude_events=exclude_events)
-                        y = other.get_slope_y(self.bbox_left)
-                        diff = self.bbox_top - y
+                        y = other.get_slope_y(st.bbox_left)
+                        diff = st.bbox_top - y
                         if diff < 0:
                             self.bbox_top = y
-                            if self.bbox_left == x:
+                            st.update()
+                            if st.bbox_left == x:
                                 self.move_y(diff, do_events=do_events,
                                             exclude_events=exclude_events)
 
@@ -715,18 +761,21 @@ class Collider(sge.dsp.Object):
                         if on_left:
                             stopper = other
                     elif not self.collision(other, y=old_y):
-                        self.bbox_top = max(self.bbox_top, other.bbox_bottom)
+                        self.bbox_top = max(st.bbox_top, other.bbox_bottom)
+                        st.update()
                         stopper = other
 
             for other in self.collision(SolidBottom):
                 if not self.collision(other, y=old_y):
-                    self.bbox_top = max(self.bbox_top, other.bbox_bottom)
+                    self.bbox_top = max(st.bbox_top, other.bbox_bottom)
+                    st.update()
                     stopper = other
 
             if do_events and stopper not in exclude_events:
                 move_loss = max(0, abs(move) - abs(self.y - old_y))
                 self.event_physics_collision_top(stopper, move_loss)
                 stopper.event_physics_collision_bottom(self, 0)
+                st.refresh()
 
         # Engage stickiness (same whether moving left or right)
         # 1 = sticking to a wall on the right
@@ -737,59 +786,61 @@ class Collider(sge.dsp.Object):
                 new_bbox_right = None
                 others = (
                     sge.game.current_room.get_objects_at(
-                        self.bbox_left, self.bbox_top,
-                        (sge.game.current_room.width - self.bbox_left +
+                        st.bbox_left, st.bbox_top,
+                        (sge.game.current_room.width - st.bbox_left +
                          sge.game.current_room.object_area_width),
-                        self.bbox_height) |
+                        st.bbox_height) |
                     sge.game.current_room.object_area_void)
                 for other in others:
-                    if (other.bbox_top >= self.bbox_bottom or
-                            other.bbox_bottom <= self.bbox_top):
+                    if (other.bbox_top >= st.bbox_bottom or
+                            other.bbox_bottom <= st.bbox_top):
                         continue
 
                     if isinstance(other, SolidLeft):
                         x = other.bbox_left
                     elif isinstance(other, SlopeTopLeft):
-                        x = other.get_slope_x(self.bbox_bottom)
+                        x = other.get_slope_x(st.bbox_bottom)
                     elif isinstance(other, SlopeBottomLeft):
-                        x = other.get_slope_x(self.bbox_top)
+                        x = other.get_slope_x(st.bbox_top)
                     else:
                         continue
 
-                    if x >= self.bbox_right and (new_bbox_right is None or
+                    if x >= st.bbox_right and (new_bbox_right is None or
                                                  x < new_bbox_right):
                         new_bbox_right = x
 
                 if new_bbox_right is not None:
                     self.bbox_right = new_bbox_right
+                    st.update()
         elif sticky == 2:
             if (not self.get_left_touching_slope() and
                     not self.get_left_touching_wall()):
                 new_bbox_left = None
                 others = (
                     sge.game.current_room.get_objects_at(
-                        0, self.bbox_top, self.bbox_right, self.bbox_height) |
+                        0, st.bbox_top, st.bbox_right, st.bbox_height) |
                     sge.game.current_room.object_area_void)
                 for other in others:
-                    if (other.bbox_top >= self.bbox_bottom or
-                            other.bbox_bottom <= self.bbox_top):
+                    if (other.bbox_top >= st.bbox_bottom or
+                            other.bbox_bottom <= st.bbox_top):
                         continue
 
                     if isinstance(other, SolidRight):
                         x = other.bbox_right
                     elif isinstance(other, SlopeTopRight):
-                        x = other.get_slope_x(self.bbox_bottom)
+                        x = other.get_slope_x(st.bbox_bottom)
                     elif isinstance(other, SlopeBottomRight):
-                        x = other.get_slope_x(self.bbox_top)
+                        x = other.get_slope_x(st.bbox_top)
                     else:
                         continue
 
-                    if x <= self.bbox_left and (new_bbox_left is None or
+                    if x <= st.bbox_left and (new_bbox_left is None or
                                                 x > new_bbox_left):
                         new_bbox_left = x
 
                 if new_bbox_left is not None:
                     self.bbox_left = new_bbox_left
+                    st.update()
 
     def get_left_touching_wall(self):
         """
@@ -1013,6 +1064,57 @@ class Collider(sge.dsp.Object):
             self.move_y(((vi + vf) / 2) * delta_mult)
 
 
+class _ColliderState:
+
+    """
+    Plain copy of the values of a :class:`Collider` which are read most
+    often while handling movement.  Reading these from the collider
+    itself goes through several properties of :class:`sge.dsp.Object`
+    each time, so :meth:`Collider.move_x` and :meth:`Collider.move_y`
+    read them from here instead.
+
+    Changes to the collider's position are still made to the collider
+    itself, since that is what SGE collision detection uses, so
+    :meth:`update` must be called after each such change.
+    """
+
+    __slots__ = ("parent", "bbox_left", "bbox_right", "bbox_top",
+                 "bbox_bottom", "bbox_width", "bbox_height", "nonstick_left",
+                 "nonstick_right", "nonstick_top", "nonstick_bottom")
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.refresh()
+
+    def refresh(self):
+        """Copy all values from the parent collider."""
+        parent = self.parent
+        self.nonstick_left = parent.nonstick_left
+        self.nonstick_right = parent.nonstick_right
+        self.nonstick_top = parent.nonstick_top
+        self.nonstick_bottom = parent.nonstick_bottom
+        self.update()
+
+    def update(self):
+        """Copy the bounding box of the parent collider."""
+        parent = self.parent
+        x = parent.x
+        y = parent.y
+        bbox_x = parent.bbox_x
+        bbox_y = parent.bbox_y
+        bbox_width = parent.bbox_width
+        bbox_height = parent.bbox_height
+
+        # Same order of operations as sge.dsp.Object uses, so that
+        # results are identical.
+        self.bbox_left = x + bbox_x
+        self.bbox_right = x + bbox_x + bbox_width
+        self.bbox_top = y + bbox_y
+        self.bbox_bottom = y + bbox_y + bbox_height
+        self.bbox_width = bbox_width
+        self.bbox_height = bbox_height
+
+
 class Wall(sge.dsp.Object):
 
     """
@@ -19,22 +19,50 @@ enhance the core functionality in an implementation-independent way.
 Like the SGE itself, they are distribted under the terms of the GNU
 Lesser General Public License.
 
-This extension provides support for loading the JSON format of the
-`Tiled Map Editor <http://www.mapeditor.org/>`_.  This allows you to use
-Tiled to edit your game's world (e.g. levels), rather than building a
-level editor yourself.
+This extension provides support for loading the JSON and TMX formats
+of the `Tiled Map Editor <http://www.mapeditor.org/>`_.  This allows you
+to use Tiled to edit your game's world (e.g. levels), rather than
+building a level editor yourself.
 
 To load a tile map, simply use :func:`load`.  See the documentation for
 this function for more information.
+
+.. data:: tileset_cache_budget
+
+   Tilesets, and the sprites sliced from their images, are kept in a
+   cache shared by all calls to :func:`load`, so that maps which use
+   the same tilesets don't need to load them again.  This is the
+   approximate amount of memory in bytes that the cache may use; once
+   it is exceeded, the least recently used tilesets are removed from
+   the cache.  Set to ``0`` to disable the cache.  See also
+   :func:`clear_tileset_cache`.
+
+   Default value: ``67108864`` (64 MiB)
 """
 
 
 __version__ = "2.0"
-__all__ = ["load"]
+__all__ = ["load", "load_iter", "load_async", "load_tmx",
+           "clear_tileset_cache"]
 
 
+import array
+import collections
+import concurrent.futures
+import hashlib
+import inspect
+import io
 import json
+import math
+import mmap
 import os
+import struct
+import sys
+import threading
+import time
+import tracemalloc
+import xml.etree.ElementTree as ElementTree
+from types import MappingProxyType
 
 import base64
 import gzip
@@ -42,6 +70,58 @@ import sge
 import xsge_path
 import zlib
 
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+CACHE_MAGIC = b"XSGETMC1"
+CACHE_HEADER = struct.Struct("<8sQQ20sI")
+
+# Fractions of a tile object's width and height by which its position
+# is moved left and up for each object alignment.
+_ALIGNMENTS = {
+    "topleft": (0, 0), "top": (0.5, 0), "topright": (1, 0),
+    "left": (0, 0.5), "center": (0.5, 0.5), "right": (1, 0.5),
+    "bottomleft": (0, 1), "bottom": (0.5, 1), "bottomright": (1, 1)}
+
+# Attributes of TMX elements which are numbers or booleans in the
+# equivalent JSON data; all other attributes are strings.
+_TMX_NUMBER_ATTRS = {
+    "x", "y", "width", "height", "tilewidth", "tileheight", "firstgid",
+    "id", "gid", "margin", "spacing", "tilecount", "columns",
+    "hexsidelength", "nextlayerid", "nextobjectid", "compressionlevel",
+    "tileid", "duration", "rotation", "opacity", "offsetx", "offsety",
+    "parallaxx", "parallaxy", "parallaxoriginx", "parallaxoriginy",
+    "probability", "tile", "pixelsize", "startx", "starty"}
+_TMX_BOOL_ATTRS = {
+    "visible", "infinite", "repeatx", "repeaty", "locked", "wrap",
+    "bold", "italic", "underline", "strikeout", "kerning", "hflip",
+    "vflip", "rotate", "preferuntransformed"}
+_TMX_LAYER_TYPES = {"layer": "tilelayer", "objectgroup": "objectgroup",
+                    "imagelayer": "imagelayer", "group": "group"}
+
+tileset_cache_budget = 64 * 1024 * 1024
+
+_tileset_cache = collections.OrderedDict()
+_tileset_cache_size = 0
+_tileset_cache_lock = threading.Lock()
+
+_load_executor = None
+_decode_executor = None
+_decode_processes = 0
+
+# Encoded tile data shorter than this many characters is decoded in the
+# current process even if worker processes are used, since sending it
+# to a worker would take longer than decoding it.
+_PARALLEL_DECODE_SIZE = 64 * 1024
+
 
 class Decoration(sge.dsp.Object):
 
@@ -109,9 +189,1181 @@ class Polyline(xsge_path.Path):
     """
 
 
-def load(fname, cls=sge.dsp.Room, types=None, z=0):
+class ChunkStreamer(sge.dsp.Object):
+
+    """
+    Class used by :func:`load` to load the chunks of a tile layer of an
+    infinite map on demand, rather than all at once.  It is invisible,
+    intangible, and doesn't check for collisions.
+
+    Chunk positions are indexed when the map is loaded, but the objects
+    of a chunk are only created once a view comes within :attr:`margin`
+    pixels of it.  When more than :attr:`max_chunks` chunks are loaded,
+    the objects of the chunks which have gone the longest without being
+    near a view are destroyed.
+
+    .. note::
+
+       When a chunk is unloaded and later loaded again, its objects are
+       created anew from the map data, so any changes made to them in
+       the meantime are lost.
+
+    .. attribute:: margin
+
+       The distance in pixels from the edge of a view within which
+       chunks are loaded.
+
+       Default value: ``256``
+
+    .. attribute:: max_chunks
+
+       The maximum number of chunks of the layer that may be loaded at
+       once.  Chunks that are near a view are never unloaded, so this
+       limit can be exceeded if the views cover more chunks than this.
+
+       Default value: ``64``
+
+    .. attribute:: chunks
+
+       A dictionary matching ``(column, row)`` tuples, which indicate
+       the position of each chunk in units of chunks, to the respective
+       chunk data from the map file.  (Read-only)
+
+    .. attribute:: loaded
+
+       An ordered dictionary matching ``(column, row)`` tuples of
+       loaded chunks to lists of the objects created for them, from
+       least to most recently used.  (Read-only)
+
+    .. attribute:: index
+
+       The :class:`ObjectIndex` object that the objects of loaded chunks
+       are added to and removed from, or :const:`None`.
+
+    .. attribute:: wangsets
+
+       A list of :class:`WangSet` objects which chunks are filled in
+       with when they are first loaded, or :const:`None`.
+
+    .. attribute:: filled
+
+       A set of ``(column, row)`` tuples of the chunks which have
+       already been filled in with :attr:`wangsets`.  (Read-only)
+    """
+
+    margin = 256
+    max_chunks = 64
+
+    def __init__(self, chunks, tilemap, layer, tile_cls, tile_sprites,
+                 tile_kwargs, default_cls, default_kwargs, types, z,
+                 tintcolor, *, sprite_cache=None, animations=None,
+                 tile_specs=None, index=None, wangsets=None):
+        super().__init__(0, 0, z, visible=False, tangible=False,
+                         checks_collisions=False)
+        self.parse_args = (tilemap, layer, tile_cls, tile_sprites,
+                           tile_kwargs, default_cls, default_kwargs, types,
+                           z, tintcolor)
+        self.sprite_cache = sprite_cache if sprite_cache is not None else {}
+        self.animations = animations
+        self.tile_specs = tile_specs if tile_specs is not None else {}
+        self.index = index
+        self.wangsets = wangsets
+        self.filled = set()
+        self.loaded = collections.OrderedDict()
+        self.chunks = {}
+
+        self.chunk_width = 1
+        self.chunk_height = 1
+        for chunk in chunks:
+            self.chunk_width = max(self.chunk_width,
+                                   chunk.get("width", tilemap["width"]))
+            self.chunk_height = max(self.chunk_height,
+                                    chunk.get("height", tilemap["height"]))
+
+        xstep, ystep = t_get_tile_steps(tilemap)
+        self.xoffset = layer.get("offsetx", 0)
+        self.yoffset = layer.get("offsety", 0)
+        self.pixel_width = self.chunk_width * xstep
+        self.pixel_height = self.chunk_height * ystep
+        self.isometric = (tilemap["orientation"] == "isometric")
+        self.tile_width = tilemap["tilewidth"]
+        self.tile_height = tilemap["tileheight"]
+        self.origin_x = tilemap["height"] * tilemap["tilewidth"] / 2
+        for chunk in chunks:
+            self.chunks[self.get_chunk_key(chunk)] = chunk
+
+    def get_chunk_key(self, chunk):
+        """
+        Return the ``(column, row)`` tuple indicating the position of
+        the chunk with the data ``chunk``.
+        """
+        layer = self.parse_args[1]
+        tx = chunk.get("x", 0) + layer.get("startx", 0)
+        ty = chunk.get("y", 0) + layer.get("starty", 0)
+        return (tx // self.chunk_width, ty // self.chunk_height)
+
+    def get_chunks_near(self, x, y, width, height):
+        """
+        Return a list of ``(column, row)`` tuples indicating the chunks
+        which are in or within :attr:`margin` pixels of the indicated
+        rectangle.
+        """
+        left = x - self.margin - self.xoffset
+        top = y - self.margin - self.yoffset
+        right = x + width + self.margin - self.xoffset
+        bottom = y + height + self.margin - self.yoffset
+
+        if self.isometric:
+            # Find the range of tiles covered by the rectangle, which
+            # is a diamond in tile coordinates, from its corners.
+            columns = []
+            rows = []
+            for px in [left - self.origin_x, right - self.origin_x]:
+                for py in [top, bottom]:
+                    columns.append(py/self.tile_height + px/self.tile_width)
+                    rows.append(py/self.tile_height - px/self.tile_width)
+            left = min(columns) * self.pixel_width / self.chunk_width
+            right = max(columns) * self.pixel_width / self.chunk_width
+            top = min(rows) * self.pixel_height / self.chunk_height
+            bottom = max(rows) * self.pixel_height / self.chunk_height
+
+        # Staggered and hexagonal chunks extend beyond their nominal
+        # size by up to half a tile, as do tiles taller than the grid
+        # in isometric maps, which is covered by going one chunk
+        # further in each direction.
+        cmin = int(math.floor(left / self.pixel_width)) - 1
+        cmax = int(math.floor(right / self.pixel_width)) + 1
+        rmin = int(math.floor(top / self.pixel_height)) - 1
+        rmax = int(math.floor(bottom / self.pixel_height)) + 1
+
+        r = []
+        for row in range(rmin, rmax + 1):
+            for column in range(cmin, cmax + 1):
+                if (column, row) in self.chunks:
+                    r.append((column, row))
+        return r
+
+    def update_chunks(self, room):
+        """
+        Load the chunks near the views of ``room`` which are not
+        already loaded, adding their objects to ``room``, and unload the
+        least recently used chunks if more than :attr:`max_chunks`
+        chunks are loaded.
+        """
+        needed = set()
+        for view in room.views:
+            needed.update(self.get_chunks_near(view.x, view.y, view.width,
+                                               view.height))
+
+        for key in needed:
+            if key in self.loaded:
+                self.loaded.move_to_end(key)
+            else:
+                # The filled in tiles are kept in the chunk's data, so
+                # they must not be filled in again when it's reloaded.
+                wangsets = self.wangsets if key not in self.filled else None
+                objects = t_parse_tilechunk(
+                    self.chunks[key], *self.parse_args,
+                    sprite_cache=self.sprite_cache,
+                    animations=self.animations, tile_specs=self.tile_specs,
+                    wangsets=wangsets)
+                if wangsets:
+                    self.filled.add(key)
+                for obj in objects:
+                    room.add(obj)
+                    if self.index is not None:
+                        self.index.add(obj, self.parse_args[1].get("name"))
+                self.loaded[key] = objects
+
+        while len(self.loaded) > self.max_chunks:
+            key = next(iter(self.loaded))
+            if key in needed:
+                break
+            for obj in self.loaded.pop(key):
+                obj.destroy()
+                if self.index is not None:
+                    self.index.remove(obj)
+
+    def unload_chunk(self, room, key):
+        """
+        Remove the objects of the chunk indicated by the ``(column,
+        row)`` tuple ``key`` from ``room`` if the chunk is loaded.
+        """
+        for obj in self.loaded.pop(key, []):
+            room.remove(obj)
+            if self.index is not None:
+                self.index.remove(obj)
+
+    def replace_chunks(self, room, chunks, removed=()):
+        """
+        Replace the data of the chunks at the positions of the chunk
+        data in ``chunks`` with that data, and remove the chunks at the
+        positions of the chunk data in ``removed``.  The objects of
+        affected chunks which are loaded are removed from ``room``, and
+        the chunks are then loaded anew as needed (see
+        :meth:`update_chunks`).
+        """
+        for chunk in removed:
+            key = self.get_chunk_key(chunk)
+            self.unload_chunk(room, key)
+            self.chunks.pop(key, None)
+            self.filled.discard(key)
+        for chunk in chunks:
+            key = self.get_chunk_key(chunk)
+            self.unload_chunk(room, key)
+            self.chunks[key] = chunk
+            self.filled.discard(key)
+        self.update_chunks(room)
+
+    def event_step(self, time_passed, delta_mult):
+        self.update_chunks(sge.game.current_room)
+
+
+class BakedLayer(sge.dsp.Object):
+
+    """
+    Class used by :func:`load` to draw the tiles of a tile layer which
+    has been baked into large pre-rendered sprites.  Every frame, the
+    sprites which are within a view are projected onto the room with
+    :meth:`sge.dsp.Room.project_sprite`, so the number of things drawn
+    for the layer depends only on the size of the views, not on the
+    number of tiles.  The object itself is invisible, intangible, and
+    doesn't check for collisions.
+
+    .. attribute:: chunk_size
+
+       The width and height of each pre-rendered sprite.  Changing this
+       only affects layers baked afterwards.
+
+       Default value: ``512``
+
+    .. attribute:: chunks
+
+       A dictionary matching ``(column, row)`` tuples, which indicate
+       the position of each pre-rendered sprite in units of
+       :attr:`chunk_size`, to the respective sprites.  (Read-only)
+    """
+
+    chunk_size = 512
+
+    def __init__(self, parts, z=0):
+        """
+        Arguments:
+
+        - ``parts`` -- A list of ``(x, y, sprite)`` tuples indicating
+          sprites to draw onto the pre-rendered sprites and where in
+          the room to draw them, as returned by
+          :func:`t_get_sprite_parts`.
+
+        All other arguments set the respective initial attributes of
+        the object.  See the documentation for :class:`BakedLayer` for
+        more information.
+        """
+        super().__init__(0, 0, z, visible=False, tangible=False,
+                         checks_collisions=False)
+        size = self.chunk_size
+        self.__size = size
+        self.chunks = {}
+
+        chunk_parts = collections.defaultdict(list)
+        for x, y, sprite in parts:
+            cmin = int(math.floor(x / size))
+            cmax = int(math.floor((x+sprite.width-1) / size))
+            rmin = int(math.floor(y / size))
+            rmax = int(math.floor((y+sprite.height-1) / size))
+            for row in range(rmin, rmax + 1):
+                for column in range(cmin, cmax + 1):
+                    chunk_parts[(column, row)].append((x, y, sprite))
+
+        for (column, row), parts in chunk_parts.items():
+            chunk = sge.gfx.Sprite(width=size, height=size)
+            chunk.draw_lock()
+            for x, y, sprite in parts:
+                chunk.draw_sprite(sprite, 0, x - column*size, y - row*size)
+            chunk.draw_unlock()
+            self.chunks[(column, row)] = chunk
+
+    def event_step(self, time_passed, delta_mult):
+        self.project_chunks()
+
+    def event_paused_step(self, time_passed, delta_mult):
+        self.project_chunks()
+
+    def project_chunks(self):
+        """
+        Project the chunks which are in view onto the current room for
+        the current frame.  This is done automatically every frame,
+        including while the game is paused.
+        """
+        room = sge.game.current_room
+        size = self.__size
+        projected = set()
+        for view in room.views:
+            cmin = int(math.floor(view.x / size))
+            cmax = int(math.floor((view.x+view.width) / size))
+            rmin = int(math.floor(view.y / size))
+            rmax = int(math.floor((view.y+view.height) / size))
+            for row in range(rmin, rmax + 1):
+                for column in range(cmin, cmax + 1):
+                    key = (column, row)
+                    chunk = self.chunks.get(key)
+                    if chunk is not None and key not in projected:
+                        projected.add(key)
+                        room.project_sprite(chunk, 0, column*size,
+                                            row*size, self.z)
+
+
+class TileAnimation:
+
+    """
+    Class used by :func:`load` to animate tiles with Tiled animations.
+    Rather than each animated tile being animated separately, every
+    instance of the same animation shows the same :attr:`sprite`,
+    whose image is replaced with that of the current frame as an
+    :class:`AnimationClock` advances the animation.  This allows each
+    frame to have its own duration, and the cost of animating is the
+    same no matter how many tiles use the animation.
+
+    .. attribute:: frames
+
+       A list of ``(sprite, duration)`` tuples indicating the sprite of
+       each frame and how long it is shown in milliseconds.
+
+    .. attribute:: sprite
+
+       The sprite showing the current frame.  (Read-only)
+
+    .. attribute:: frame
+
+       The index of the current frame in :attr:`frames`.  (Read-only)
+
+    .. attribute:: time
+
+       The time in milliseconds which the current frame has been shown
+       for.  (Read-only)
+
+    .. attribute:: variants
+
+       A list of animations which show flipped or tinted versions of
+       this animation's frames and are kept on the same frame as this
+       animation.  See :meth:`get_variant`.  (Read-only)
+    """
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.frame = 0
+        self.time = 0
+        self.variants = []
+
+        width = max([1] + [sprite.width for sprite, duration in frames])
+        height = max([1] + [sprite.height for sprite, duration in frames])
+        self.sprite = sge.gfx.Sprite(width=width, height=height)
+        self.redraw()
+
+    def advance(self, time_passed):
+        """
+        Advance the animation by ``time_passed`` milliseconds, changing
+        the image of :attr:`sprite` and those of :attr:`variants` if
+        the frame changes.
+        """
+        total = sum([duration for sprite, duration in self.frames])
+        if total <= 0:
+            return
+
+        self.time = (self.time+time_passed) % total
+        frame = self.frame
+        while self.time >= self.frames[frame][1]:
+            self.time -= self.frames[frame][1]
+            frame = (frame+1) % len(self.frames)
+
+        if frame != self.frame:
+            self.frame = frame
+            self.redraw()
+            for variant in self.variants:
+                variant.frame = frame
+                variant.redraw()
+
+    def redraw(self):
+        """Draw the current frame onto :attr:`sprite`."""
+        self.sprite.draw_clear()
+        if self.frames:
+            self.sprite.draw_sprite(self.frames[self.frame][0], 0, 0, 0)
+
+    def get_variant(self, hflip, vflip, dflip, tintcolor):
+        """
+        Return a new animation which shows the frames of this animation
+        transformed by :func:`t_transform_sprite` with the arguments
+        given, and add it to :attr:`variants`.
+        """
+        variant = TileAnimation([
+            (t_transform_sprite(sprite, hflip, vflip, dflip, tintcolor),
+             duration) for sprite, duration in self.frames])
+        variant.frame = self.frame
+        variant.redraw()
+        self.variants.append(variant)
+        return variant
+
+
+class AnimationClock(sge.dsp.Object):
+
+    """
+    Class used by :func:`load` to advance all of the
+    :class:`TileAnimation` objects of a map.  It is invisible,
+    intangible, and doesn't check for collisions.
+
+    .. attribute:: animations
+
+       The list of animations which are advanced by this object.
+    """
+
+    def __init__(self, animations):
+        super().__init__(0, 0, visible=False, tangible=False,
+                         checks_collisions=False)
+        self.animations = animations
+
+    def event_step(self, time_passed, delta_mult):
+        for animation in self.animations:
+            animation.advance(time_passed)
+
+
+class WangSet:
+
+    """
+    Class which fills in tile data with the tiles of a Tiled Wang set
+    (also known as a terrain set) so that the terrains of neighboring
+    cells join up, much like Tiled's terrain brush does.  These are
+    created by :func:`t_get_wangsets`, and :func:`load` uses them if its
+    ``autotile`` argument is :const:`True`.
+
+    Each cell with a tile of the Wang set is considered to be painted
+    with a terrain, which is the color appearing the most in the tile's
+    Wang ID (the lowest such color in case of a tie).  Filling in a cell
+    replaces its tile with the one whose Wang ID best matches its
+    surroundings: each side is given the terrain of the cell on that
+    side, and each corner is given the cell's own terrain if the three
+    cells around the corner all have it, or otherwise the terrain of
+    the first one of them that doesn't, checking the cell sharing the
+    side above or below the corner, then the cell sharing the side to
+    the left or right, then the diagonal cell.  Cells without tiles of
+    the Wang set have no terrain (``0``), and cells outside of the grid
+    are considered to have the terrain of the cell being filled in.
+    Only sides are compared for ``"edge"`` Wang sets, and only corners
+    for ``"corner"`` Wang sets.
+
+    .. attribute:: name
+
+       The name of the Wang set.
+
+    .. attribute:: type
+
+       The type of the Wang set: ``"corner"``, ``"edge"``, or
+       ``"mixed"``.
+
+    .. attribute:: tiles
+
+       A dictionary matching the GID of each tile of the Wang set to its
+       Wang ID, a tuple of the colors of its top, top-right, right,
+       bottom-right, bottom, bottom-left, left, and top-left.
+
+    .. attribute:: terrains
+
+       A dictionary matching the GID of each tile of the Wang set to the
+       terrain of cells with that tile.  (Read-only)
+
+    .. attribute:: matches
+
+       A dictionary matching ``(wangid, terrain)`` tuples which have
+       been looked up with :meth:`get_tile` to the GIDs found for them.
+       (Read-only)
+    """
+
+    def __init__(self, name, type_, tiles):
+        self.name = name
+        self.type = type_
+        self.tiles = tiles
+        self.terrains = {}
+        for gid, wangid in tiles.items():
+            colors = [color for color in wangid if color]
+            if colors:
+                self.terrains[gid] = min(
+                    set(colors), key=lambda color: (-colors.count(color),
+                                                    color))
+        self.matches = {}
+
+    def get_terrains(self, tiles):
+        """
+        Return a list of the terrain of each cell with a GID in the
+        sequence ``tiles``.
+        """
+        terrains = self.terrains
+        return [terrains.get(gid & 0x1FFFFFFF, 0) for gid in tiles]
+
+    def get_tile(self, wangid, terrain=0):
+        """
+        Return the GID of the tile whose Wang ID matches the Wang ID
+        ``wangid`` (see :attr:`tiles`) in the most places, ignoring
+        sides or corners as appropriate for :attr:`type`.  In case of a
+        tie, tiles with the terrain ``terrain`` are preferred, and then
+        the first such tile in the Wang set is chosen.
+        """
+        gid = self.matches.get((wangid, terrain))
+        if gid is None:
+            if self.type == "corner":
+                places = range(1, 8, 2)
+            elif self.type == "edge":
+                places = range(0, 8, 2)
+            else:
+                places = range(8)
+
+            best = None
+            for tile_gid, tile_wangid in self.tiles.items():
+                score = (sum(1 for i in places
+                             if tile_wangid[i] == wangid[i]),
+                         self.terrains.get(tile_gid) == terrain)
+                if best is None or score > best:
+                    gid = tile_gid
+                    best = score
+            self.matches[(wangid, terrain)] = gid
+        return gid
+
+    def autotile(self, tiles, width, height, terrains=None, cells=None):
+        """
+        Fill in the cells of the grid of GIDs ``tiles``, a mutable
+        sequence of ``width`` times ``height`` values in row-major
+        order, and return the list of the terrain of each cell.
+
+        If ``terrains`` is not :const:`None`, it is used as the list of
+        the terrain of each cell instead of finding them from ``tiles``
+        with :meth:`get_terrains`.  Keeping the list returned by a
+        previous call allows terrains to be painted by changing it,
+        including those of cells whose tiles have been filled in in a
+        way that no longer shows their terrain the most.  Cells without
+        a terrain are left alone.
+
+        If ``cells`` is :const:`None`, every cell is filled in.
+        Otherwise, it is a sequence of ``(column, row)`` tuples
+        indicating cells whose terrains have been changed, and only
+        these cells and the cells around them are filled in.  For
+        example, to paint a cell of a layer while the game is running::
+
+            terrains[row*width + column] = terrain
+            wangset.autotile(tiles, width, height, terrains,
+                             cells=[(column, row)])
+        """
+        if terrains is None:
+            terrains = self.get_terrains(tiles)
+
+        if cells is None:
+            indexes = range(len(tiles))
+        else:
+            indexes = set()
+            for column, row in cells:
+                for y in range(max(0, row - 1), min(height, row + 2)):
+                    for x in range(max(0, column - 1),
+                                   min(width, column + 2)):
+                        indexes.add(y*width + x)
+
+        for i in indexes:
+            terrain = terrains[i]
+            if not terrain:
+                continue
+
+            x = i % width
+            y = i // width
+            left = x > 0
+            right = x < width - 1
+            top = y > 0
+            bottom = y < height - 1
+            n = terrains[i - width] if top else terrain
+            s = terrains[i + width] if bottom else terrain
+            w = terrains[i - 1] if left else terrain
+            e = terrains[i + 1] if right else terrain
+            nw = terrains[i - width - 1] if top and left else terrain
+            ne = terrains[i - width + 1] if top and right else terrain
+            sw = terrains[i + width - 1] if bottom and left else terrain
+            se = terrains[i + width + 1] if bottom and right else terrain
+
+            corners = []
+            for around in [(n, e, ne), (s, e, se), (s, w, sw), (n, w, nw)]:
+                corner = terrain
+                for other in around:
+                    if other != terrain:
+                        corner = other
+                        break
+                corners.append(corner)
+
+            wangid = (n, corners[0], e, corners[1], s, corners[2], w,
+                      corners[3])
+            tiles[i] = self.get_tile(wangid, terrain)
+
+        return terrains
+
+
+class LoadProfile:
+
+    """
+    Class which records how long each part of loading a map took and
+    how much was created, returned by :func:`load` if its ``profile``
+    argument is :const:`True`.  Converting it to a string gives a
+    readable report.  All times are in seconds.
+
+    Memory is measured with :mod:`tracemalloc`, which is started for
+    the duration of the load if it isn't already tracing.  Tracing
+    memory slows down loading, so times are higher than they would be
+    without profiling.
+
+    .. attribute:: times
+
+       A dictionary matching the name of each phase of loading to the
+       time spent on it.  The phases are:
+
+       - ``"read"`` -- Reading and parsing the map file.
+       - ``"tilesets"`` -- Loading tileset images and slicing them
+         into sprites.
+       - ``"decode"`` -- Decoding the data of tile layers.
+       - ``"objects"`` -- Classifying tiles and creating objects for
+         tiles, objects, and image layers; this is all of the time
+         spent on layers not counted by other phases.
+       - ``"tilegrids"`` -- Creating :class:`sge.gfx.TileGrid`
+         sprites.
+       - ``"room"`` -- Creating the room, including loading the
+         streamed chunks which are initially in view.
+
+    .. attribute:: layers
+
+       A list of dictionaries with information about each top-level
+       layer of the map, in order, with the following keys:
+
+       - ``"name"`` -- The name of the layer.
+       - ``"time"`` -- The time spent on the layer.
+       - ``"objects"`` -- The number of objects created for the layer.
+       - ``"grid_tiles"`` -- The number of tiles of the layer which
+         were put into :class:`sge.gfx.TileGrid` sprites rather than
+         having objects of their own.
+       - ``"memory"`` -- The number of bytes allocated for the layer
+         which were still allocated when it was finished.
+
+    .. attribute:: memory
+
+       A dictionary matching ``"read"``, ``"tilesets"``, ``"layers"``,
+       and ``"room"`` to the number of bytes allocated during the
+       respective phases of loading (see :attr:`times`; ``"layers"``
+       covers all phases done for layers) which were still allocated
+       at the end of the phase.
+
+    .. attribute:: peak_memory
+
+       The largest number of bytes allocated at once during the load,
+       not counting memory which was already allocated when it started.
+
+    .. attribute:: allocations
+
+       The number of memory blocks allocated during the load which were
+       still allocated when it was finished.
+
+    .. attribute:: objects
+
+       The total number of objects created for the map's layers.
+       Objects for the chunks of streamed layers are not counted.
+
+    .. attribute:: grid_tiles
+
+       The total number of tiles put into :class:`sge.gfx.TileGrid`
+       sprites rather than having objects of their own.
+
+    .. attribute:: sprites
+
+       The number of sprites created for the map's layers, i.e. flipped
+       and tinted tile sprites (including the frames of flipped and
+       tinted animations) and the sprites of point, rectangle, and
+       ellipse objects.  Sprites which were already created by an
+       earlier layer are not counted again.
+    """
+
+    def __init__(self):
+        self.times = dict.fromkeys(["read", "tilesets", "decode", "objects",
+                                    "tilegrids", "room"], 0)
+        self.layers = []
+        self.memory = dict.fromkeys(["read", "tilesets", "layers", "room"],
+                                    0)
+        self.peak_memory = 0
+        self.allocations = 0
+        self.objects = 0
+        self.grid_tiles = 0
+        self.sprites = 0
+
+    def __str__(self):
+        lines = ["{:<10} {:9.4f}s".format(name, t)
+                 for name, t in self.times.items()]
+        lines.append("{:<10} {:9.4f}s".format("total",
+                                              sum(self.times.values())))
+        for name, size in self.memory.items():
+            lines.append("{:<10} {:9} bytes".format(name, size))
+        lines.append("{:<10} {:9} bytes".format("peak", self.peak_memory))
+        for layer in self.layers:
+            lines.append(
+                "layer {!r}: {:.4f}s, {} bytes, {} objects, {} grid tiles"
+                .format(layer["name"], layer["time"], layer["memory"],
+                        layer["objects"], layer["grid_tiles"]))
+        lines.append(
+            "{} objects, {} grid tiles, {} sprites, {} allocations".format(
+                self.objects, self.grid_tiles, self.sprites,
+                self.allocations))
+        return "\n".join(lines)
+
+
+class ObjectIndex:
+
+    """
+    Class which indexes the objects of a map by name, type, layer, and
+    position, so that they can be found without searching through all
+    of a room's objects.  :func:`load` creates one of these for the
+    room if its ``index`` argument is :const:`True`.
+
+    Positions are indexed by dividing the room into a grid of cells and
+    recording which cells each object's bounding box overlaps.  Objects
+    whose bounding boxes overlap more than :attr:`max_cells` cells, such
+    as the objects holding the :class:`sge.gfx.TileGrid` sprites of
+    whole tile layers, are instead kept in a separate list which every
+    query checks.
+
+    .. note::
+
+       The index records where objects were when they were added.  If
+       an indexed object moves, :meth:`update` must be called for
+       :meth:`rectangle` to find it in its new position.
+
+    .. attribute:: cell_width
+
+       The width of each cell of the grid.  (Read-only)
+
+    .. attribute:: cell_height
+
+       The height of each cell of the grid.  (Read-only)
+
+    .. attribute:: max_cells
+
+       The largest number of cells an object may be recorded in.
+
+       Default value: ``64``
+
+    .. attribute:: names
+
+       A dictionary matching the names objects have in the map to lists
+       of the objects with each name.  Objects without names are not
+       included.  (Read-only)
+
+    .. attribute:: types
+
+       A dictionary matching the types objects have in the map to lists
+       of the objects with each type.  Objects without types are not
+       included.  (Read-only)
+
+    .. attribute:: layers
+
+       A dictionary matching the names of the map's layers to lists of
+       the objects created for each layer.  (Read-only)
+    """
+
+    max_cells = 64
+
+    def __init__(self, cell_width=256, cell_height=256):
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.names = {}
+        self.types = {}
+        self.layers = {}
+        self.cells = {}
+        self.large = {}
+        self.entries = {}
+
+    def get_cells(self, x, y, width, height):
+        """
+        Return a list of ``(column, row)`` tuples indicating the cells
+        which the indicated rectangle overlaps.  If there are more than
+        :attr:`max_cells` of them, return :const:`None` instead.
+        """
+        cmin = int(math.floor(x / self.cell_width))
+        cmax = int(math.floor((x+width) / self.cell_width))
+        rmin = int(math.floor(y / self.cell_height))
+        rmax = int(math.floor((y+height) / self.cell_height))
+        if (cmax-cmin+1) * (rmax-rmin+1) > self.max_cells:
+            return None
+        return [(column, row) for row in range(rmin, rmax + 1)
+                for column in range(cmin, cmax + 1)]
+
+    def add(self, obj, layer=None, name=None, type_=None):
+        """
+        Add ``obj`` to the index.  ``layer`` is the name of the layer
+        ``obj`` is from, and ``name`` and ``type_`` are the name and
+        type ``obj`` has in the map, or :const:`None` if it doesn't have
+        one.  If ``obj`` is already in the index, nothing happens.
+        """
+        if id(obj) in self.entries:
+            return
+
+        for d, key in [(self.layers, layer), (self.names, name),
+                       (self.types, type_)]:
+            if key:
+                d.setdefault(key, []).append(obj)
+
+        cells = self.get_cells(obj.bbox_left, obj.bbox_top,
+                               obj.bbox_width, obj.bbox_height)
+        if cells is None:
+            self.large[id(obj)] = obj
+        else:
+            for cell in cells:
+                self.cells.setdefault(cell, {})[id(obj)] = obj
+        self.entries[id(obj)] = (obj, layer, name, type_, cells)
+
+    def remove(self, obj):
+        """
+        Remove ``obj`` from the index.  If ``obj`` is not in the index,
+        nothing happens.
+        """
+        entry = self.entries.pop(id(obj), None)
+        if entry is None:
+            return
+
+        obj, layer, name, type_, cells = entry
+        for d, key in [(self.layers, layer), (self.names, name),
+                       (self.types, type_)]:
+            if key:
+                d[key].remove(obj)
+                if not d[key]:
+                    del d[key]
+
+        if cells is None:
+            del self.large[id(obj)]
+        else:
+            for cell in cells:
+                del self.cells[cell][id(obj)]
+                if not self.cells[cell]:
+                    del self.cells[cell]
+
+    def update(self, obj):
+        """
+        Record the current position of ``obj``, which must be in the
+        index.
+        """
+        obj, layer, name, type_, cells = self.entries[id(obj)]
+        self.remove(obj)
+        self.add(obj, layer, name, type_)
+
+    def rectangle(self, x, y, width, height):
+        """
+        Return a list of the indexed objects whose bounding boxes
+        overlap the indicated rectangle.  Unlike
+        :func:`sge.collision.rectangle`, this only compares bounding
+        boxes and includes objects which are not tangible.
+        """
+        candidates = dict(self.large)
+        cells = self.get_cells(x, y, width, height)
+        if cells is None:
+            for obj_id, entry in self.entries.items():
+                candidates[obj_id] = entry[0]
+        else:
+            for cell in cells:
+                candidates.update(self.cells.get(cell, {}))
+
+        right = x + width
+        bottom = y + height
+        return [obj for obj in candidates.values()
+                if (obj.bbox_left < right and obj.bbox_right > x
+                    and obj.bbox_top < bottom and obj.bbox_bottom > y)]
+
+
+class MapReloader(sge.dsp.Object):
+
+    """
+    Class used by :func:`load` to watch a map for changes while the
+    game is running and apply them to the room, which is useful while
+    designing levels.  It is invisible, intangible, and doesn't check
+    for collisions.
+
+    Every :attr:`interval` seconds, the modification times of the map
+    file, its external tilesets, and the object templates it uses are
+    checked.  If only the map file has changed, it is read again and
+    only the top-level layers which differ from before, or which now
+    have different Z-axis positions, are replaced: the objects created
+    for them before are removed from the room, and new objects are
+    created for them.  Of streamed layers (see the ``stream_chunks``
+    argument of :func:`load`) whose settings are unchanged, only the
+    chunks which differ are replaced.  If anything else has changed,
+    every layer is replaced.
+
+    .. note::
+
+       Any changes made to the objects of a layer while the game is
+       running are lost when the layer is replaced.  The properties and
+       background color of the map are not applied to the room again.
+
+    .. attribute:: interval
+
+       The number of seconds between checks for changes.
+
+       Default value: ``0.5``
+
+    .. attribute:: fname
+
+       The file name of the map.  (Read-only)
+
+    .. attribute:: files
+
+       A list of the file names whose modification times are checked,
+       starting with :attr:`fname`.  (Read-only)
+
+    .. attribute:: layers
+
+       A list of dictionaries with information about each top-level
+       layer of the map as it was last loaded, in order, with the
+       following keys:
+
+       - ``"digest"`` -- A hash of the layer's data, not including the
+         chunks of streamed layers.
+       - ``"chunks"`` -- A dictionary matching the ``(x, y)`` position
+         of each chunk of a streamed layer to a hash of its data, or
+         :const:`None` if the layer is not streamed.
+       - ``"objects"`` -- The objects created for the layer.
+       - ``"views"`` -- The views created for the layer.
+       - ``"z"`` -- The Z-axis position of the layer.
+       - ``"next_z"`` -- The Z-axis position of the next layer.
+
+       (Read-only)
+    """
+
+    interval = 0.5
+
+    def __init__(self, fname, digest, tilemap, types, z, tilesets, layers,
+                 *, templates=None, sprite_cache=None, clock=None,
+                 cache=False, stream_chunks=False, bake_layers=False,
+                 shape_sprites=True, index=None, wangsets=None):
+        super().__init__(0, 0, z, visible=False, tangible=False,
+                         checks_collisions=False)
+        self.fname = fname
+        self.digest = digest
+        self.types = types
+        self.tilesets = tilesets
+        self.layers = layers
+        self.sprite_cache = sprite_cache if sprite_cache is not None else {}
+        self.clock = clock
+        self.cache = cache
+        self.stream_chunks = stream_chunks
+        self.bake_layers = bake_layers
+        self.shape_sprites = shape_sprites
+        self.index = index
+        self.wangsets = wangsets
+        self.template_files = set()
+        self.files = self.get_files(tilemap, templates)
+        self.mtimes = [_mtime(fname) for fname in self.files]
+        self.elapsed = 0
+
+    def get_files(self, tilemap, templates=None):
+        """
+        Return a list of the file names to check for changes for the
+        map data ``tilemap``, starting with :attr:`fname`.  ``templates``
+        is the dictionary of templates used when loading the map (see
+        :func:`t_resolve_template`).
+        """
+        tmdir = os.path.dirname(self.fname)
+        files = [self.fname]
+        for tileset in tilemap.get("tilesets", []):
+            if tileset.get("source"):
+                files.append(os.path.join(tmdir, tileset["source"]))
+        if templates:
+            self.template_files.update(templates)
+        files.extend(sorted(self.template_files))
+        return files
+
+    def remove_objects(self, room, objects):
+        """
+        Remove ``objects``, as well as the objects of the loaded chunks
+        of any :class:`ChunkStreamer` objects among them, from ``room``
+        and from :attr:`index`.
+        """
+        for obj in objects:
+            if isinstance(obj, ChunkStreamer):
+                for key in list(obj.loaded):
+                    obj.unload_chunk(room, key)
+            room.remove(obj)
+            if self.index is not None:
+                self.index.remove(obj)
+
+    def update(self, room):
+        """
+        Check whether the map has changed and, if it has, apply the
+        changes to ``room``.  Return whether or not the map had changed.
+
+        The new map is read and parsed before ``room`` is changed, so
+        if this fails (for example because the map was read while it
+        was only partly saved), the exception is raised and ``room`` is
+        left as it was.  The map is then read again by the next call.
+        """
+        mtimes = [_mtime(fname) for fname in self.files]
+        if mtimes == self.mtimes:
+            return False
+
+        tmdir = os.path.dirname(self.fname)
+        tilemap = t_read_tilemap(self.fname, cache=self.cache)
+        digest = _data_digest({key: value for key, value in tilemap.items()
+                               if key != "layers"})
+        layers = tilemap.get("layers", [])
+
+        # Digests are taken before parsing, which modifies the data.
+        digests = [_layer_digests(layer, self.stream_chunks)
+                   for layer in layers]
+        room_width, room_height = _set_tilemap_defaults(tilemap)
+
+        full = (digest != self.digest or mtimes[1:] != self.mtimes[1:])
+        if full:
+            tilesets = t_get_tilesets(tilemap, tmdir, self.types)
+            wangsets = self.wangsets
+            if wangsets is not None:
+                wangsets = t_get_wangsets(tilemap, tmdir)
+            sprite_cache = {}
+            old_layers = []
+        else:
+            tilesets = self.tilesets
+            wangsets = self.wangsets
+            sprite_cache = self.sprite_cache
+            old_layers = self.layers
+
+        # Every changed layer is parsed before anything is removed from
+        # the room, so that an error leaves the room as it was.
+        (tile_cls, tile_sprites, tile_kwargs, tile_objectalignment,
+         tile_animations) = tilesets
+        encoding_chunks = []
+        templates = {}
+        z = self.z
+        records = []
+        new_records = []
+        chunk_changes = []
+        try:
+            for i, layer in enumerate(layers):
+                layer_digest, chunks = digests[i]
+                old = old_layers[i] if i < len(old_layers) else None
+                if (old is not None and old["z"] == z
+                        and old["digest"] == layer_digest):
+                    if chunks is not None and chunks != old["chunks"]:
+                        changed = [chunk for chunk in layer["chunks"]
+                                   if (old["chunks"].get(_chunk_pos(chunk))
+                                       != chunks[_chunk_pos(chunk)])]
+                        encoding = layer.get("encoding", "csv")
+                        compression = layer.get("compression")
+                        for chunk in changed:
+                            chunk["data"] = t_data_decode(
+                                chunk.get("data", []), encoding, compression)
+                        removed = [{"x": x, "y": y} for x, y in old["chunks"]
+                                   if (x, y) not in chunks]
+                        chunk_changes.append((old, changed, removed))
+                        old = dict(old, chunks=chunks)
+                    records.append(old)
+                    z = old["next_z"]
+                    continue
+
+                objects, views, next_z = t_parse_layer(
+                    layer, tilemap, tmdir, tile_cls, tile_sprites,
+                    tile_kwargs, tile_objectalignment, self.types, z,
+                    stream_chunks=self.stream_chunks,
+                    sprite_cache=sprite_cache, animations=tile_animations,
+                    bake_layers=self.bake_layers,
+                    shape_sprites=self.shape_sprites, templates=templates,
+                    index=self.index, wangsets=wangsets)
+                record = {"digest": layer_digest, "chunks": chunks,
+                          "objects": objects, "views": views, "z": z,
+                          "next_z": next_z}
+                records.append(record)
+                new_records.append((old, record))
+                z = next_z
+        except BaseException:
+            if self.index is not None:
+                for old, record in new_records:
+                    for obj in record["objects"]:
+                        self.index.remove(obj)
+            raise
+
+        if full:
+            self.digest = digest
+            self.tilesets = tilesets
+            self.wangsets = wangsets
+            self.sprite_cache = sprite_cache
+            self.template_files = set()
+            for record in self.layers:
+                self.remove_objects(room, record["objects"])
+
+            room.width = room_width
+            room.height = room_height
+            if self.clock is not None:
+                room.remove(self.clock)
+                self.clock = None
+            if tile_animations:
+                self.clock = AnimationClock(list(tile_animations.values()))
+                room.add(self.clock)
+
+        views_changed = False
+        for old, record in new_records:
+            if old is not None:
+                self.remove_objects(room, old["objects"])
+                views_changed = views_changed or bool(old["views"])
+            for obj in record["objects"]:
+                room.add(obj)
+                if isinstance(obj, ChunkStreamer):
+                    obj.update_chunks(room)
+            views_changed = views_changed or bool(record["views"])
+
+        for old in old_layers[len(layers):]:
+            self.remove_objects(room, old["objects"])
+            views_changed = views_changed or bool(old["views"])
+
+        self.layers = records
+        for old, changed, removed in chunk_changes:
+            for obj in old["objects"]:
+                if isinstance(obj, ChunkStreamer):
+                    obj.replace_chunks(room, changed, removed)
+
+        if views_changed:
+            views = [view for record in self.layers
+                     for view in record["views"]]
+            if views:
+                room.views = views
+
+        self.files = self.get_files(tilemap, templates)
+        self.mtimes = [mtimes[0]] + [_mtime(fname)
+                                     for fname in self.files[1:]]
+        return True
+
+    def event_step(self, time_passed, delta_mult):
+        self.elapsed += time_passed / 1000
+        if self.elapsed >= self.interval:
+            self.elapsed = 0
+            try:
+                self.update(sge.game.current_room)
+            except (OSError, ValueError, zlib.error, ElementTree.ParseError):
+                # The map is most likely in the middle of being saved,
+                # so it's left alone until the next check.
+                pass
+
+
+def clear_tileset_cache():
+    """
+    Remove everything from the cache of tilesets shared by calls to
+    :func:`load`.  See the documentation for
+    :data:`tileset_cache_budget` for more information.
+    """
+    global _tileset_cache_size
+    with _tileset_cache_lock:
+        _tileset_cache.clear()
+        _tileset_cache_size = 0
+
+
+def load(fname, cls=sge.dsp.Room, types=None, z=0, *, stream_chunks=False,
+         cache=False, tilemap=None, bake_layers=False, shape_sprites=True,
+         profile=False, processes=0, index=False, watch=False,
+         autotile=False):
     """
     Load JSON tilemap ``fname`` and return a room of the class ``cls``.
+    If ``fname`` has the extension ``.tmx``, it is instead read as a
+    TMX (XML) tilemap; see :func:`load_tmx`.
 
     The way the map generates the room, in general, is to convert all
     tiles, objects, and image layers into :class:`sge.dsp.Object`
@@ -174,37 +1426,492 @@ def load(fname, cls=sge.dsp.Room, types=None, z=0):
 
     - Image layers have their properties applied to them.
 
-    .. note::
-
-       Currently zstd compression is **not** supported. Support for zstd
-       will be added later either when it makes it into the Pyhton
-       Standard Library or, if that doesn't happen, when it's clear what
-       zstd library to use.
+    Objects which are instances of object templates (``.tj`` or
+    ``.tx`` files) are treated as if the template's object, with the
+    instance's own values and properties overriding the template's,
+    were in the map.  Each template file is only read once.
+
+    If ``stream_chunks`` is set to :const:`True`, the chunks of tile
+    layers in infinite maps are not converted into objects right away.
+    Instead, a :class:`ChunkStreamer` object is created for each such
+    layer, which creates the objects of each chunk as views approach it
+    and destroys them again once they are far away.  This can greatly
+    reduce load times and memory use for large infinite maps.
+
+    If ``cache`` is set to :const:`True`, the parsed map, with all of
+    its tile data already decoded, is saved in a binary cache file
+    next to ``fname`` (with ``".cache"`` appended to the file name),
+    and later loads of the same map read this file instead of parsing
+    and decoding the map again.  See :func:`t_read_tilemap` for more
+    information.
+
+    If ``bake_layers`` is set to :const:`True`, the tiles of each tile
+    layer which would otherwise be drawn by :class:`Decoration`
+    objects (including :class:`sge.gfx.TileGrid` objects) are instead
+    drawn once onto large sprites when the map is loaded, and a single
+    :class:`BakedLayer` object draws the parts of these sprites which
+    are in view.  This makes drawing large static layers much cheaper,
+    but uses more memory.  Animated tiles and the chunks of layers
+    streamed with ``stream_chunks`` are not baked.
+
+    Point, rectangle, and ellipse objects are given sprites showing
+    their shapes in their object group's color.  Objects with the same
+    shape, size, and color share the same sprite, so these sprites
+    should not be modified.  If ``shape_sprites`` is set to
+    :const:`False`, such objects which are invisible (which
+    :class:`Point` and :class:`Rectangle` objects are by default) are
+    not given sprites at all; instead, their sizes are set with the
+    ``bbox_width`` and ``bbox_height`` keyword arguments.
+
+    If ``tilemap`` is not :const:`None`, it is used as the tilemap data
+    instead of reading ``fname``, which is then only used to find files
+    referenced by the tilemap.  This is intended to be used with the
+    result of :func:`load_async`.
+
+    If ``processes`` is greater than ``0``, the data of large tile
+    layers and chunks is decoded in that many worker processes (see
+    :class:`concurrent.futures.ProcessPoolExecutor`) while the objects
+    of earlier layers are being created, which makes loading maps with
+    a lot of compressed tile data faster on computers with multiple
+    cores.  The worker processes are kept for later loads with the same
+    number of processes.  Objects are always created in the current
+    process.
+
+    If ``index`` is set to :const:`True`, the room is given an
+    attribute, ``object_index``, which is an :class:`ObjectIndex`
+    object that the objects created for the map are added to, allowing
+    them to be found quickly by name, type, layer, and position.  For
+    example::
+
+        room = xsge_tiled.load("level.json", index=True)
+        spawns = room.object_index.types.get("spawn", [])
+        nearby = room.object_index.rectangle(0, 0, 320, 240)
+
+    The cells of the index are eight tiles wide and high.  The objects
+    of streamed chunks are added to the index while they are loaded.
+
+    If ``autotile`` is set to :const:`True`, the tiles of tile layers
+    which belong to the Wang sets of the map's tilesets are replaced so
+    that the terrains they are painted with join up (see
+    :class:`WangSet`).  This allows a map to be drawn with just one
+    tile for each terrain.  The chunks of infinite maps are filled in
+    separately from one another.
+
+    If ``watch`` is set to :const:`True`, a :class:`MapReloader` object
+    is added to the room, which applies changes made to the map to the
+    room while the game is running.  This is meant to be used while
+    designing levels, so that changes can be seen without restarting
+    the game.
+
+    If ``profile`` is set to :const:`True`, a tuple containing the room
+    and a :class:`LoadProfile` object describing where the time spent
+    loading the map went is returned instead of just the room.  For
+    example::
+
+        room, profile = xsge_tiled.load("level.json", profile=True)
+        print(profile)
 
     .. note::
 
-       Only orthogonal, staggered, and hexagonal maps are supported.
-       For best results, the following conditions should be adhered to:
+       zstd compression requires either Python 3.14 or later, or the
+       `zstandard <https://pypi.org/project/zstandard/>`_ library.
 
-       - Stagger index should be set to "odd".
-       - For non-hexagonal staggered maps, stagger axis should be set to
-         "y". (Does not apply to hexagonal maps; in the case of
-         hexagonal maps, both "x" and "y" will work just as well.)
+    .. note::
 
-       Maps which do not adhere to these conditions will still render
-       correctly, but adhering to these conditions will allow
-       :class:`sge.gfx.TileGrid` to be used, which allows for better
-       performance.
+       Objects in isometric maps are positioned according to where
+       their origins are projected to, but their shapes are not
+       projected, except for the points of polygons and polylines.
+    """
+    return _drain(load_iter(fname, cls, types, z,
+                            stream_chunks=stream_chunks, cache=cache,
+                            tilemap=tilemap, bake_layers=bake_layers,
+                            shape_sprites=shape_sprites, profile=profile,
+                            processes=processes, index=index, watch=watch,
+                            autotile=autotile))
+
+
+def load_iter(fname, cls=sge.dsp.Room, types=None, z=0, *,
+              stream_chunks=False, cache=False, tilemap=None,
+              bake_layers=False, shape_sprites=True, profile=False,
+              processes=0, index=False, watch=False, autotile=False,
+              time_budget=None, object_budget=None):
+    """
+    Return a generator which does the same thing as :func:`load`, but
+    pauses periodically so that the work can be spread across multiple
+    frames, for example to keep a loading screen animated.
+
+    Each time the generator pauses, it yields the progress made so far
+    as a factor from ``0`` to ``1`` (not including ``1``) of the tiles
+    and objects in the map which have been processed.  When it is
+    finished, it raises :exc:`StopIteration` with the room (or, if
+    ``profile`` is :const:`True`, the room and the profile) as its
+    value, as a generator returning the room would.  Time spent paused
+    is not counted by the profile.
+
+    Arguments other than those listed below are the same as for
+    :func:`load`.
+
+    - ``time_budget`` -- The number of seconds to work for before
+      pausing, or :const:`None` for no limit.
+    - ``object_budget`` -- The number of tiles and objects to process
+      before pausing, or :const:`None` for no limit.
+
+    If both ``time_budget`` and ``object_budget`` are :const:`None`,
+    the generator pauses after each layer.
+
+    For example, the following loads a map while updating a
+    :class:`xsge_gui.ProgressBar` once per frame::
+
+        class LoadingRoom(sge.dsp.Room):
+
+            def event_room_start(self):
+                self.loader = xsge_tiled.load_iter("level.json",
+                                                   time_budget=1/120)
+
+            def event_step(self, time_passed, delta_mult):
+                try:
+                    progress_bar.progress = next(self.loader)
+                except StopIteration as e:
+                    e.value.start()
     """
     if types is None:
         types = {}
 
-    with open(fname, 'r') as f:
-        tilemap = json.load(f)
+    load_profile = None
+    if profile:
+        load_profile = LoadProfile()
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        start_snapshot = tracemalloc.take_snapshot()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        peak_memory = start_memory
+
+    phase_start = time.perf_counter()
+    phase_memory = _traced_memory()
+    if tilemap is None:
+        tilemap = t_read_tilemap(fname, cache=cache)
+    if profile:
+        load_profile.times["read"] = time.perf_counter() - phase_start
+        load_profile.memory["read"] = _traced_memory() - phase_memory
+
+    map_z = z
+    if watch:
+        digest = _data_digest({key: value for key, value in tilemap.items()
+                               if key != "layers"})
 
     # Setting the default values of stuff here; other code below takes
     # advantage of this by forgoing use of get() and setdefault(), so
     # this must be retained and must be above everything else.
+    room_width, room_height = _set_tilemap_defaults(tilemap)
+
+    c = tilemap.get("backgroundcolor")
+    if c:
+        color = t_get_color(c)
+        background = sge.gfx.Background([], color)
+    else:
+        background = None
+
+    tmdir = os.path.dirname(fname)
+
+    object_index = None
+    if index:
+        object_index = ObjectIndex(tilemap["tilewidth"] * 8,
+                                   tilemap["tileheight"] * 8)
+
+    phase_start = time.perf_counter()
+    phase_memory = _traced_memory()
+    (tile_cls, tile_sprites, tile_kwargs, tile_objectalignment,
+     tile_animations) = t_get_tilesets(tilemap, tmdir, types)
+    wangsets = t_get_wangsets(tilemap, tmdir) if autotile else []
+    if profile:
+        load_profile.times["tilesets"] = time.perf_counter() - phase_start
+        load_profile.memory["tilesets"] = _traced_memory() - phase_memory
+
+    layers = tilemap.get("layers", [])
+    decoding = {}
+    if processes > 0:
+        decoding = t_submit_decode(layers, _get_decode_executor(processes),
+                                   stream_chunks=stream_chunks)
+
+    total = max(1, _count_work(layers, tilemap, stream_chunks))
+    done = 0
+    yield 0
+
+    start = time.perf_counter()
+    budget_done = 0
+    sprite_cache = {}
+    templates = {}
+    objects = []
+    views = []
+    records = []
+    for layer in layers:
+        if watch:
+            # Digests are taken before parsing, which modifies the data.
+            layer_digest, chunks = _layer_digests(layer, stream_chunks)
+            layer_z = z
+
+        for chunk, future in decoding.pop(id(layer), []):
+            chunk["data"] = future.result()
+
+        gen = t_iter_layer(
+            layer, tilemap, tmdir, tile_cls, tile_sprites, tile_kwargs,
+            tile_objectalignment, types, z, stream_chunks=stream_chunks,
+            sprite_cache=sprite_cache, animations=tile_animations,
+            bake_layers=bake_layers, shape_sprites=shape_sprites,
+            profile=load_profile, templates=templates, index=object_index,
+            wangsets=wangsets)
+        layer_time = 0
+        layer_memory = 0
+        grid_tiles = load_profile.grid_tiles if profile else 0
+        while True:
+            phase_start = time.perf_counter()
+            phase_memory = _traced_memory()
+            try:
+                amount = next(gen)
+            except StopIteration as e:
+                new_objects, new_views, z = e.value
+                layer_time += time.perf_counter() - phase_start
+                layer_memory += _traced_memory() - phase_memory
+                break
+            layer_time += time.perf_counter() - phase_start
+            layer_memory += _traced_memory() - phase_memory
+
+            done += amount
+            budget_done += amount
+            if ((time_budget is not None
+                    and time.perf_counter() - start >= time_budget)
+                    or (object_budget is not None
+                        and budget_done >= object_budget)):
+                yield min(done / total, 0.999)
+                start = time.perf_counter()
+                budget_done = 0
+
+        objects.extend(new_objects)
+        views.extend(new_views)
+        if watch:
+            records.append({"digest": layer_digest, "chunks": chunks,
+                            "objects": new_objects, "views": new_views,
+                            "z": layer_z, "next_z": z})
+        if profile:
+            load_profile.layers.append({
+                "name": layer.get("name"), "time": layer_time,
+                "objects": len(new_objects),
+                "grid_tiles": load_profile.grid_tiles - grid_tiles,
+                "memory": layer_memory})
+            load_profile.objects += len(new_objects)
+            load_profile.memory["layers"] += layer_memory
+            peak_memory = max(peak_memory, tracemalloc.get_traced_memory()[1])
+        if time_budget is None and object_budget is None:
+            yield min(done / total, 0.999)
+
+    clock = None
+    if tile_animations:
+        clock = AnimationClock(list(tile_animations.values()))
+        objects.append(clock)
+
+    if watch:
+        objects.append(MapReloader(
+            fname, digest, tilemap, types, map_z,
+            (tile_cls, tile_sprites, tile_kwargs, tile_objectalignment,
+             tile_animations),
+            records, templates=templates, sprite_cache=sprite_cache,
+            clock=clock, cache=cache, stream_chunks=stream_chunks,
+            bake_layers=bake_layers, shape_sprites=shape_sprites,
+            index=object_index, wangsets=wangsets if autotile else None))
+
+    phase_start = time.perf_counter()
+    phase_memory = _traced_memory()
+    room_kwargs = {
+        "objects": objects, "width": room_width, "height": room_height,
+        "views": views if views else None, "background": background}
+    room_kwargs.update(t_get_properties(tilemap.get("properties", [])))
+
+    room = cls(**room_kwargs)
+    if index:
+        room.object_index = object_index
+
+    # Load the chunks that are initially visible right away so that
+    # they're present on the first frame.
+    for obj in objects:
+        if isinstance(obj, ChunkStreamer):
+            obj.update_chunks(room)
+
+    if profile:
+        times = load_profile.times
+        times["room"] = time.perf_counter() - phase_start
+        times["objects"] = (sum(layer["time"]
+                                for layer in load_profile.layers)
+                            - times["decode"] - times["tilegrids"])
+        load_profile.memory["room"] = _traced_memory() - phase_memory
+        peak_memory = max(peak_memory, tracemalloc.get_traced_memory()[1])
+        load_profile.peak_memory = max(0, peak_memory - start_memory)
+
+        stats = tracemalloc.take_snapshot().compare_to(start_snapshot,
+                                                       "filename")
+        load_profile.allocations = max(
+            0, sum(stat.count_diff for stat in stats))
+        if started_tracing:
+            tracemalloc.stop()
+
+        return room, load_profile
+
+    return room
+
+
+def load_async(fname, *, cache=False):
+    """
+    Start reading JSON tilemap ``fname`` in a background thread and
+    return a :class:`concurrent.futures.Future` for the result.  All of
+    the tile data in the map is decoded, and any external tilesets are
+    read, in the background thread as well.
+
+    The result of the future is meant to be passed to :func:`load` as
+    its ``tilemap`` argument, along with the same ``fname``, which then
+    only needs to create the room and its objects.  For example, to
+    start loading the next level while the current one is being
+    played::
+
+        future = xsge_tiled.load_async("level2.json")
+
+    And later, once the level is needed::
+
+        room = xsge_tiled.load("level2.json", tilemap=future.result())
+
+    Maps are read one at a time in the order they were requested.
+    ``cache`` has the same meaning as for :func:`load`.
+    """
+    global _load_executor
+    if _load_executor is None:
+        _load_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1)
+
+    return _load_executor.submit(t_preload_tilemap, fname, cache=cache)
+
+
+def load_tmx(fname, cls=sge.dsp.Room, types=None, z=0, **kwargs):
+    """
+    Load TMX (XML) tilemap ``fname`` and return a room of the class
+    ``cls``.  This does the same thing as :func:`load` and takes the
+    same arguments, but ``fname`` is always read as a TMX tilemap
+    regardless of its extension.
+
+    The map is parsed incrementally (see :func:`t_read_tmx`) and
+    converted into the same data as the map's JSON export, so
+    everything that applies to JSON tilemaps applies to TMX tilemaps
+    as well.  External tilesets in the TSX format are also supported,
+    both by this function and by :func:`load`; a tileset is read as
+    TSX if its extension is ``.tsx``.
+    """
+    if kwargs.get("tilemap") is None:
+        kwargs["tilemap"] = t_read_tilemap(
+            fname, cache=kwargs.get("cache", False), tmx=True)
+    return load(fname, cls, types, z, **kwargs)
+
+
+def t_submit_decode(layers, executor, *, stream_chunks=False):
+    """
+    Submit the decoding of the data of the large tile layers and chunks
+    in the list of layers ``layers`` to the executor ``executor`` (a
+    :class:`concurrent.futures.Executor`) and return a dictionary
+    matching the :func:`id` of each layer in ``layers`` to a list of
+    ``(chunk, future)`` tuples, where ``chunk`` is the tile layer or
+    chunk (which can be inside a group layer) whose data is being
+    decoded, and ``future`` is the :class:`concurrent.futures.Future`
+    for the result of :func:`t_data_decode`.  The data of each chunk
+    should be replaced with the result of its future before the layer
+    is parsed.
+
+    If ``stream_chunks`` is :const:`True`, the chunks of tile layers
+    are not decoded, since they are decoded as they are loaded by
+    :class:`ChunkStreamer` objects.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    def submit(layer, pending):
+        for sublayer in layer.get("layers", []):
+            submit(sublayer, pending)
+
+        if layer.get("type") != "tilelayer":
+            return
+
+        chunks = [] if stream_chunks else list(layer.get("chunks", []))
+        chunks.append(layer)
+        encoding = layer.get("encoding", "csv")
+        compression = layer.get("compression")
+        for chunk in chunks:
+            data = chunk.get("data")
+            if isinstance(data, str) and len(data) >= _PARALLEL_DECODE_SIZE:
+                pending.append((chunk, executor.submit(
+                    t_data_decode, data, encoding, compression)))
+
+    decoding = {}
+    for layer in layers:
+        pending = []
+        submit(layer, pending)
+        if pending:
+            decoding[id(layer)] = pending
+    return decoding
+
+
+def _get_decode_executor(processes):
+    # Return the process pool used to decode tile data with the
+    # indicated number of processes, replacing the previous one if it
+    # has a different number.
+    global _decode_executor, _decode_processes
+    if _decode_executor is None or _decode_processes != processes:
+        if _decode_executor is not None:
+            _decode_executor.shutdown(wait=False)
+        _decode_executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes)
+        _decode_processes = processes
+    return _decode_executor
+
+
+def t_preload_tilemap(fname, *, cache=False):
+    """
+    Read JSON tilemap ``fname`` with :func:`t_read_tilemap`, decode all
+    of its tile data in place, read its external tilesets into the
+    tileset cache, and return the loaded data.  This is what
+    :func:`load_async` does in the background.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    tilemap = t_read_tilemap(fname, cache=cache)
+
+    def decode(layers):
+        for layer in layers:
+            decode(layer.get("layers", []))
+            encoding = layer.get("encoding", "csv")
+            compression = layer.get("compression")
+            for chunk in [layer] + layer.get("chunks", []):
+                if "data" in chunk:
+                    chunk["data"] = t_data_decode(chunk["data"], encoding,
+                                                  compression)
+
+    decode(tilemap.get("layers", []))
+
+    tmdir = os.path.dirname(fname)
+    for tileset in tilemap.get("tilesets", []):
+        if tileset.get("source"):
+            t_read_tileset(os.path.join(tmdir, tileset["source"]))
+
+    return tilemap
+
+
+def _traced_memory():
+    # Return the amount of memory currently traced by tracemalloc, or
+    # zero if it isn't tracing.
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    return 0
+
+
+def _set_tilemap_defaults(tilemap):
+    # Set the default values of the tilemap's settings and return
+    # the size of the room it makes.
     room_width = (tilemap.setdefault("width", 1)
                   * tilemap.setdefault("tilewidth", 32))
     room_height = (tilemap.setdefault("height", 1)
@@ -227,34 +1934,404 @@ def load(fname, cls=sge.dsp.Room, types=None, z=0):
         else:
             room_height = (room_height/2 + tilemap["tileheight"]/2
                            + tilemap["height"]*tilemap["hexsidelength"])
+    elif tilemap["orientation"] == "isometric":
+        room_width = ((tilemap["width"]+tilemap["height"])
+                      * tilemap["tilewidth"] // 2)
+        room_height = ((tilemap["width"]+tilemap["height"])
+                       * tilemap["tileheight"] // 2)
+
+    return room_width, room_height
+
+
+def _data_digest(data):
+    # Return a hash of JSON-like data for noticing changes to it.
+    return hashlib.sha1(json.dumps(data, sort_keys=True,
+                                   default=_digest_default).encode()).digest()
+
+
+def _digest_default(value):
+    # Tile data read from the cache is a memoryview, whose repr holds
+    # its address, so the tiles themselves are hashed instead.
+    if isinstance(value, (array.array, memoryview)):
+        return hashlib.sha1(memoryview(value).cast("B")).hexdigest()
+    return repr(value)
+
+
+def _chunk_pos(chunk):
+    return (chunk.get("x", 0), chunk.get("y", 0))
+
+
+def _layer_digests(layer, stream_chunks):
+    # Return the digest of layer and, if its chunks are streamed, a
+    # dictionary of the digests of its chunks by position.
+    if (stream_chunks and layer.get("type") == "tilelayer"
+            and layer.get("chunks")):
+        chunks = {_chunk_pos(chunk): _data_digest(chunk)
+                  for chunk in layer["chunks"]}
+        return (_data_digest({key: value for key, value in layer.items()
+                              if key != "chunks"}),
+                chunks)
+    return _data_digest(layer), None
+
+
+def _drain(gen):
+    # Run the generator gen to completion and return its return value.
+    while True:
+        try:
+            next(gen)
+        except StopIteration as e:
+            return e.value
+
+
+def _count_work(layers, tilemap, stream_chunks):
+    # Return the number of tiles and objects in layers, as counted by
+    # the amounts yielded by t_iter_layer.
+    total = 0
+    for layer in layers:
+        type_ = layer.get("type")
+        if type_ == "group":
+            total += _count_work(layer.get("layers", []), tilemap,
+                                 stream_chunks)
+        elif type_ == "tilelayer":
+            chunks = [] if stream_chunks else list(layer.get("chunks", []))
+            if "data" in layer:
+                chunks.append(layer)
+            for chunk in chunks:
+                total += (chunk.get("width", tilemap["width"])
+                          * chunk.get("height", tilemap["height"]))
+        elif type_ == "objectgroup":
+            total += len(layer.get("objects", []))
+        elif type_ == "imagelayer":
+            total += 1
+    return total
+
+
+def t_read_tilemap(fname, *, cache=False, tmx=None):
+    """
+    Read the JSON tilemap ``fname`` and return the loaded data.
 
-    c = tilemap.get("backgroundcolor")
-    if c:
-        color = t_get_color(c)
-        background = sge.gfx.Background([], color)
-    else:
-        background = None
+    If ``tmx`` is :const:`True`, ``fname`` is instead read as a TMX
+    (XML) tilemap with :func:`t_read_tmx`.  If it is :const:`None`,
+    this is decided by whether or not ``fname`` has the extension
+    ``.tmx``.
 
-    tmdir = os.path.dirname(fname)
+    If ``cache`` is :const:`True`, the data is instead read from the
+    cache file for ``fname`` (see :func:`t_read_cache`) if it is valid,
+    and otherwise all of the tile data in the map is decoded and the
+    result is written to the cache file (see :func:`t_write_cache`) so
+    that it can be used next time.
 
-    (tile_cls, tile_sprites, tile_kwargs,
-     tile_objectalignment) = t_get_tilesets(tilemap, tmdir, types)
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    if tmx is None:
+        tmx = os.path.splitext(fname)[1].lower() == ".tmx"
+
+    if not cache:
+        if tmx:
+            return t_read_tmx(fname)
+        with open(fname, 'r') as f:
+            return json.load(f)
+
+    cache_fname = fname + ".cache"
+    tilemap = t_read_cache(cache_fname, fname)
+    if tilemap is None:
+        with open(fname, 'rb') as f:
+            source = f.read()
+        if tmx:
+            tilemap = t_read_tmx(io.BytesIO(source))
+        else:
+            tilemap = json.loads(source.decode("utf-8"))
+        t_write_cache(cache_fname, fname, tilemap,
+                      hashlib.sha1(source).digest())
+    return tilemap
 
-    objects = []
-    views = []
-    for layer in tilemap.get("layers", []):
-        new_objects, new_views, z = t_parse_layer(
-            layer, tilemap, tmdir, tile_cls, tile_sprites, tile_kwargs,
-            tile_objectalignment, types, z)
-        objects.extend(new_objects)
-        views.extend(new_views)
 
-    room_kwargs = {
-        "objects": objects, "width": room_width, "height": room_height,
-        "views": views if views else None, "background": background}
-    room_kwargs.update(t_get_properties(tilemap.get("properties", [])))
+def t_read_tmx(fname):
+    """
+    Read the TMX (XML) file ``fname``, which can be a map, a tileset
+    (TSX), or a template (TX), and return its data converted into the
+    structure of the equivalent JSON file.  ``fname`` can also be a
+    file object opened in binary mode.
+
+    The file is parsed incrementally with
+    :func:`xml.etree.ElementTree.iterparse`, and each element is
+    discarded as soon as it has been converted, so the whole document
+    is never held in memory at once.  Tile data stored as ``<tile>``
+    elements is collected directly into an :class:`array.array`;
+    encoded tile data is left encoded, as in JSON data.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    elements = []
+    children = [[]]
+    gids = []
+    for event, elem in ElementTree.iterparse(fname, events=("start", "end")):
+        if event == "start":
+            if elem.tag in {"data", "chunk"}:
+                gids.append(array.array("I"))
+            elements.append(elem)
+            children.append([])
+            continue
+
+        elements.pop()
+        elem_children = children.pop()
+        parent_tag = elements[-1].tag if elements else None
+        if elem.tag == "tile" and parent_tag in {"data", "chunk"}:
+            gids[-1].append(int(elem.get("gid", 0)))
+        else:
+            tiles = gids.pop() if elem.tag in {"data", "chunk"} else None
+            children[-1].append((elem.tag, _tmx_convert(
+                elem, parent_tag, elem_children, tiles)))
+
+        # The element has been fully converted, so it is removed from
+        # its parent to keep memory use bounded.
+        if elements:
+            del elements[-1][:]
+
+    return children[0][0][1]
+
+
+def _tmx_convert(elem, parent_tag, children, tiles):
+    # Convert TMX element elem, whose child elements were converted into
+    # the (tag, value) pairs in children, into its JSON equivalent.
+    # tiles is the array of GIDs of <tile> children of data and chunk
+    # elements.
+    tag = elem.tag
+    d = {}
+    for key, value in elem.attrib.items():
+        if key in _TMX_NUMBER_ATTRS:
+            value = _tmx_number(value)
+        elif key in _TMX_BOOL_ATTRS:
+            value = value not in {"0", "false"}
+        d[key] = value
+
+    if tag in {"properties", "animation", "wangsets"}:
+        return [value for child_tag, value in children]
+    elif tag == "property":
+        type_ = d.setdefault("type", "string")
+        value = d.get("value", elem.text or "")
+        if type_ in {"int", "object"}:
+            value = int(value)
+        elif type_ == "float":
+            value = _tmx_number(value)
+        elif type_ == "bool":
+            value = (value == "true")
+        elif type_ == "class":
+            value = {}
+            for child_tag, child in children:
+                if child_tag == "properties":
+                    value = {p["name"]: p["value"] for p in child}
+        d["value"] = value
+        return d
+    elif tag in {"polygon", "polyline"}:
+        points = []
+        for point in d.get("points", "").split():
+            x, y = point.split(",")
+            points.append({"x": _tmx_number(x), "y": _tmx_number(y)})
+        return points
+    elif tag == "wangtile":
+        d["wangid"] = [int(i) for i in d.get("wangid", "").split(",")]
+        return d
+    elif tag == "text":
+        d["text"] = elem.text or ""
+        return d
+    elif tag in {"data", "chunk"}:
+        chunks = [value for child_tag, value in children
+                  if child_tag == "chunk"]
+        if chunks:
+            d["chunks"] = chunks
+        elif not tiles and elem.text and elem.text.strip():
+            d["data"] = elem.text
+        else:
+            d["data"] = tiles
+        return d
+
+    if tag in _TMX_LAYER_TYPES:
+        d["type"] = _TMX_LAYER_TYPES[tag]
+    elif tag in {"map", "tileset", "template"} and parent_tag is None:
+        d["type"] = tag
+
+    for child_tag, value in children:
+        if child_tag in _TMX_LAYER_TYPES and tag != "tile":
+            d.setdefault("layers", []).append(value)
+        elif child_tag in {"tileset", "object"} and tag == "template":
+            d[child_tag] = value
+        elif child_tag in {"tileset", "object", "tile", "wangtile"}:
+            key = {"wangtile": "wangtiles"}.get(child_tag, child_tag + "s")
+            d.setdefault(key, []).append(value)
+        elif child_tag == "wangcolor":
+            d.setdefault("colors", []).append(value)
+        elif child_tag == "image":
+            d["image"] = value.get("source", "")
+            if "trans" in value:
+                d["transparentcolor"] = "#" + value["trans"].lstrip("#")
+            if tag != "imagelayer":
+                d["imagewidth"] = value.get("width", 0)
+                d["imageheight"] = value.get("height", 0)
+        elif child_tag == "data":
+            d.update(value)
+        elif child_tag in {"ellipse", "point"}:
+            d[child_tag] = True
+        else:
+            d[child_tag] = value
+
+    return d
+
+
+def _tmx_number(value):
+    # Convert the TMX number string value into an int if it's a whole
+    # number, as JSON data has it, or a float otherwise.
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
 
-    return cls(**room_kwargs)
+
+def t_read_cache(cache_fname, fname):
+    """
+    Return the tilemap data stored in the cache file ``cache_fname``,
+    or :const:`None` if there is no valid cache file.  The cache file
+    is valid if it was written by :func:`t_write_cache` for the same
+    contents as the JSON tilemap ``fname`` currently has; this is
+    checked by modification time and size, or if those don't match,
+    by hashing the contents of ``fname``.
+
+    The cache file is memory-mapped, and tile data is returned as
+    :class:`memoryview` objects referencing the mapping directly, so
+    that no time is spent copying it.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    try:
+        st = os.stat(fname)
+        f = open(cache_fname, 'rb')
+    except OSError:
+        return None
+
+    with f:
+        header = f.read(CACHE_HEADER.size)
+        if len(header) < CACHE_HEADER.size:
+            return None
+
+        magic, mtime, size, digest, meta_size = CACHE_HEADER.unpack(header)
+        if magic != CACHE_MAGIC:
+            return None
+
+        if mtime != st.st_mtime_ns or size != st.st_size:
+            with open(fname, 'rb') as sf:
+                if hashlib.sha1(sf.read()).digest() != digest:
+                    return None
+
+            # Contents are unchanged, so just record the new
+            # modification time to skip hashing next time.
+            try:
+                with open(cache_fname, 'r+b') as wf:
+                    wf.write(CACHE_HEADER.pack(CACHE_MAGIC, st.st_mtime_ns,
+                                               st.st_size, digest, meta_size))
+            except OSError:
+                pass
+
+        tilemap = json.loads(f.read(meta_size).decode("utf-8"))
+        start = CACHE_HEADER.size + meta_size
+        start += -start % 4
+        try:
+            data = memoryview(mmap.mmap(f.fileno(), 0,
+                                        access=mmap.ACCESS_READ))
+        except ValueError:
+            # Empty mapping; there is no tile data.
+            data = memoryview(b"")
+
+    def restore(layers):
+        for layer in layers:
+            restore(layer.get("layers", []))
+            for chunk in [layer] + layer.get("chunks", []):
+                ref = chunk.get("data")
+                if isinstance(ref, dict):
+                    offset = start + ref["offset"]
+                    tiles = data[offset:(offset + 4*ref["length"])]
+                    if (sys.byteorder == "little"
+                            and array.array("I").itemsize == 4):
+                        tiles = tiles.cast("I")
+                    else:
+                        tiles = array.array("I", [
+                            int.from_bytes(tiles[i:(i + 4)], "little")
+                            for i in range(0, len(tiles), 4)])
+                    chunk["data"] = tiles
+
+    restore(tilemap.get("layers", []))
+    return tilemap
+
+
+def t_write_cache(cache_fname, fname, tilemap, digest):
+    """
+    Decode all tile data in ``tilemap``, which was loaded from the JSON
+    tilemap ``fname``, and write the result to the cache file
+    ``cache_fname`` to be read by :func:`t_read_cache`.  ``digest`` is
+    the SHA-1 digest of the contents of ``fname``.  Tile data in
+    ``tilemap`` is replaced with the decoded data.
+
+    The cache file consists of a header, followed by ``tilemap`` encoded
+    as JSON with tile data replaced by references, followed by the tile
+    data as unsigned 32-bit little-endian integers.
+
+    If the cache file can't be written, it is silently left as-is.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    blocks = []
+    offset = 0
+
+    def strip(layers):
+        nonlocal offset
+        stripped = []
+        for layer in layers:
+            slayer = layer.copy()
+            if "layers" in layer:
+                slayer["layers"] = strip(layer["layers"])
+
+            chunks = layer.get("chunks", [])
+            schunks = [chunk.copy() for chunk in chunks]
+            if chunks:
+                slayer["chunks"] = schunks
+
+            encoding = layer.get("encoding", "csv")
+            compression = layer.get("compression")
+            for chunk, schunk in zip([layer] + chunks, [slayer] + schunks):
+                if "data" in chunk:
+                    tiles = array.array("I", t_data_decode(
+                        chunk["data"], encoding, compression))
+                    chunk["data"] = tiles
+                    block = array.array("I", tiles)
+                    if sys.byteorder != "little":
+                        block.byteswap()
+                    blocks.append(block.tobytes())
+                    schunk["data"] = {"offset": offset, "length": len(tiles)}
+                    offset += len(blocks[-1])
+
+            stripped.append(slayer)
+        return stripped
+
+    meta = tilemap.copy()
+    meta["layers"] = strip(tilemap.get("layers", []))
+    meta = json.dumps(meta, separators=(',', ':')).encode("utf-8")
+
+    tmp_fname = cache_fname + ".tmp"
+    try:
+        st = os.stat(fname)
+        with open(tmp_fname, 'wb') as f:
+            f.write(CACHE_HEADER.pack(CACHE_MAGIC, st.st_mtime_ns,
+                                      st.st_size, digest, len(meta)))
+            f.write(meta)
+            f.write(bytes(-(CACHE_HEADER.size + len(meta)) % 4))
+            for block in blocks:
+                f.write(block)
+        os.replace(tmp_fname, cache_fname)
+    except OSError:
+        pass
 
 
 def t_get_tilesets(tilemap, tmdir, types):
@@ -265,10 +2342,15 @@ def t_get_tilesets(tilemap, tmdir, types):
 
     - A dictionary linking Tiled GID keys to classes found in ``types``.
     - A dictionary linking Tiled GID keys to SGE sprites.
-    - A dictionary linking Tiled GID keys to keyword argument
-      dictionaries based on the properties of the tileset and tiles.
+    - A dictionary linking Tiled GID keys to read-only keyword
+      argument mappings based on the properties of the tileset and
+      tiles.  Tiles without properties of their own share the same
+      mapping as the rest of their tileset.
     - A dictionary linkint Tiled GID keys to objectalignment values
       specified in Tiled.
+    - A dictionary linking Tiled GID keys of animated tiles to
+      :class:`TileAnimation` objects.  The sprites of these tiles in
+      the second dictionary are the animations' sprites.
 
     This is a low-level function used internally by this library; you
     don't typically need to use it.
@@ -282,6 +2364,8 @@ def t_get_tilesets(tilemap, tmdir, types):
     tile_sprites = {}
     tile_kwargs = {}
     tile_objectalignment = {}
+    tile_animations = {}
+    animation_frames = {}
     for tileset in tilemap.get("tilesets", []):
         # Must get this first because it's level data, not tileset data.
         firstgid = tileset.get("firstgid", 1)
@@ -290,10 +2374,10 @@ def t_get_tilesets(tilemap, tmdir, types):
         if tileset.setdefault("source"):
             fname = os.path.join(tmdir, tileset["source"])
             tsdir = os.path.dirname(fname)
-            with open(fname) as f:
-                tileset = json.load(f)
+            tileset = t_read_tileset(fname)
 
-        ts_kwargs = t_get_properties(tileset.get("properties", []))
+        ts_kwargs = MappingProxyType(
+            t_get_properties(tileset.get("properties", [])))
 
         ts_cls = None
         if tileset.setdefault("name") in types:
@@ -311,30 +2395,39 @@ def t_get_tilesets(tilemap, tmdir, types):
             tilewidth = tileset.get("tilewidth", tilemap["tilewidth"])
             tileheight = tileset.get("tileheight", tilemap["tileheight"])
 
-            if "transparentcolor" in tileset:
-                transparent = t_get_color(tileset["transparentcolor"])
-            else:
-                transparent = True
-
-            name, ext = os.path.splitext(os.path.basename(image_fname))
-            d = os.path.dirname(image_fname)
-            raw_sprite = sge.gfx.Sprite(name, d)
-            width = raw_sprite.width - 2*margin
-            height = raw_sprite.height - 2*margin
-            columns = int((width+spacing) / (tilewidth+spacing))
-            rows = int((height+spacing) / (tileheight+spacing))
+            image_fname = os.path.abspath(image_fname)
+            key = ("image", image_fname, _mtime(image_fname),
+                   margin, spacing, tilewidth, tileheight,
+                   tileset.get("transparentcolor"))
+            ts_sprites = _tileset_cache_get(key)
+            if ts_sprites is None:
+                if "transparentcolor" in tileset:
+                    transparent = t_get_color(tileset["transparentcolor"])
+                else:
+                    transparent = True
 
-            ts_sprites = sge.gfx.Sprite.from_tileset(
-                image_fname, x=margin, y=margin, columns=columns, rows=rows,
-                xsep=spacing, ysep=spacing, width=tilewidth, height=tileheight,
-                transparent=transparent).get_spritelist()
+                name, ext = os.path.splitext(os.path.basename(image_fname))
+                d = os.path.dirname(image_fname)
+                raw_sprite = sge.gfx.Sprite(name, d)
+                width = raw_sprite.width - 2*margin
+                height = raw_sprite.height - 2*margin
+                columns = int((width+spacing) / (tilewidth+spacing))
+                rows = int((height+spacing) / (tileheight+spacing))
+
+                ts_sprites = sge.gfx.Sprite.from_tileset(
+                    image_fname, x=margin, y=margin, columns=columns,
+                    rows=rows, xsep=spacing, ysep=spacing, width=tilewidth,
+                    height=tileheight,
+                    transparent=transparent).get_spritelist()
+                _tileset_cache_put(key, ts_sprites,
+                                   sum(_sprite_size(i) for i in ts_sprites))
 
             for i in range(len(ts_sprites)):
                 gid = firstgid + i
                 tile_sprites[gid] = ts_sprites[i]
                 if ts_cls:
                     tile_cls[gid] = ts_cls
-                tile_kwargs[gid] = ts_kwargs.copy()
+                tile_kwargs[gid] = ts_kwargs
                 tile_objectalignment[gid] = ts_objectalignment
 
         for tile in tileset.get("tiles", []):
@@ -343,44 +2436,228 @@ def t_get_tilesets(tilemap, tmdir, types):
             if ts_cls and gid not in tile_cls:
                 tile_cls[gid] = ts_cls
             if gid not in tile_kwargs:
-                tile_kwargs[gid] = ts_kwargs.copy()
+                tile_kwargs[gid] = ts_kwargs
 
             animation = tile.get("animation", [])
             if animation:
-                # Use average frame rate (since the SGE can't animate
-                # different frames at different rates in an easy way)
-                fps = (1000 * len(animation)
-                       / sum([i.get("duration", 0) for i in animation]))
-
-                sprite = sge.gfx.Sprite(width=1, height=1, fps=fps)
-                while sprite.frames < len(animation):
-                    sprite.append_frame()
-
-                for i in range(len(animation)):
-                    frame_gid = firstgid + animation[i].get("tileid", 0)
-                    if frame_gid in tile_sprites:
-                        frame_sprite = tile_sprites[frame_gid]
-                        w = max(sprite.width, frame_sprite.width)
-                        h = max(sprite.height, frame_sprite.height)
-                        if w > sprite.width or height > sprite.height:
-                            sprite.resize_canvas(w, h)
-                        sprite.draw_sprite(frame_sprite, 0, 0, 0, frame=i)
-
-                tile_sprites[gid] = sprite
+                # Frames can be tiles which haven't been loaded yet, so
+                # the animation is created once all tiles are loaded.
+                animation_frames[gid] = [
+                    (firstgid + frame.get("tileid", 0),
+                     frame.get("duration", 0)) for frame in animation]
             elif tile.setdefault("image"):
-                image_fname = os.path.join(tsdir, tile["image"])
-                name, ext = os.path.splitext(os.path.basename(image_fname))
-                d = os.path.dirname(image_fname)
-                tile_sprites[gid] = sge.gfx.Sprite(name, d)
+                image_fname = os.path.abspath(
+                    os.path.join(tsdir, tile["image"]))
+                key = ("sprite", image_fname,
+                       _mtime(image_fname))
+                sprite = _tileset_cache_get(key)
+                if sprite is None:
+                    name, ext = os.path.splitext(
+                        os.path.basename(image_fname))
+                    d = os.path.dirname(image_fname)
+                    sprite = sge.gfx.Sprite(name, d)
+                    _tileset_cache_put(key, sprite, _sprite_size(sprite))
+                tile_sprites[gid] = sprite
+
+            properties = tile.get("properties")
+            if properties:
+                kwargs = dict(tile_kwargs[gid])
+                kwargs.update(t_get_properties(properties))
+                tile_kwargs[gid] = MappingProxyType(kwargs)
+
+    for gid, frames in animation_frames.items():
+        animation = TileAnimation([
+            (tile_sprites[frame_gid], duration)
+            for frame_gid, duration in frames if frame_gid in tile_sprites])
+        tile_animations[gid] = animation
+        tile_sprites[gid] = animation.sprite
+
+    return (tile_cls, tile_sprites, tile_kwargs, tile_objectalignment,
+            tile_animations)
+
+
+def t_get_wangsets(tilemap, tmdir):
+    """
+    Return a list of :class:`WangSet` objects for the Wang sets of the
+    tilesets of ``tilemap``.  ``tmdir`` indicates the directory that the
+    data from ``tilemap`` is from.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    wangsets = []
+    for tileset in tilemap.get("tilesets", []):
+        firstgid = tileset.get("firstgid", 1)
+        if tileset.get("source"):
+            tileset = t_read_tileset(os.path.join(tmdir, tileset["source"]))
+
+        for wangset in tileset.get("wangsets", []):
+            tiles = {}
+            for wangtile in wangset.get("wangtiles", []):
+                wangid = tuple(wangtile.get("wangid", []))
+                if len(wangid) == 8:
+                    tiles[firstgid + wangtile.get("tileid", 0)] = wangid
+            if tiles:
+                wangsets.append(WangSet(wangset.get("name"),
+                                        wangset.get("type", "mixed"), tiles))
 
-            tile_kwargs[gid].update(
-                t_get_properties(tile.get("properties", [])))
+    return wangsets
 
-    return tile_cls, tile_sprites, tile_kwargs, tile_objectalignment
+
+def t_read_tileset(fname):
+    """
+    Read the external JSON tileset ``fname`` and return the loaded
+    data, using the tileset cache (see :data:`tileset_cache_budget`).
+    If ``fname`` has the extension ``.tsx``, it is read as a TSX (XML)
+    tileset with :func:`t_read_tmx` instead.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    fname = os.path.abspath(fname)
+    key = ("tileset", fname, _mtime(fname))
+    tileset = _tileset_cache_get(key)
+    if tileset is None:
+        if os.path.splitext(fname)[1].lower() == ".tsx":
+            tileset = t_read_tmx(fname)
+        else:
+            with open(fname) as f:
+                tileset = json.load(f)
+        _tileset_cache_put(key, tileset, 0)
+    return tileset
+
+
+def t_read_template(fname):
+    """
+    Read the JSON object template ``fname`` and return the loaded data,
+    using the tileset cache (see :data:`tileset_cache_budget`).  If
+    ``fname`` has the extension ``.tx``, it is read as a TX (XML)
+    template with :func:`t_read_tmx` instead.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    fname = os.path.abspath(fname)
+    key = ("template", fname, _mtime(fname))
+    template = _tileset_cache_get(key)
+    if template is None:
+        if os.path.splitext(fname)[1].lower() == ".tx":
+            template = t_read_tmx(fname)
+        else:
+            with open(fname) as f:
+                template = json.load(f)
+        _tileset_cache_put(key, template, 0)
+    return template
+
+
+def t_resolve_template(obj, tilemap, tmdir, templates):
+    """
+    Return a copy of the Tiled object ``obj``, which is an instance of
+    an object template, with the values of the template's object which
+    ``obj`` doesn't override filled in.  Properties are merged by name,
+    with those of ``obj`` taking precedence.  ``tmdir`` indicates the
+    directory that the data from ``tilemap`` is from.
+
+    If the template's object is a tile, its GID is converted from the
+    template's tileset to the same tileset in ``tilemap``.  If
+    ``tilemap`` doesn't have the tileset, the object is left without a
+    tile.
+
+    ``templates`` is a dictionary matching the absolute file name of
+    each template which has been read to its object, converted for
+    ``tilemap``, so that each template is only read once.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    fname = os.path.abspath(os.path.join(tmdir, obj["template"]))
+    base = templates.get(fname)
+    if base is None:
+        template = t_read_template(fname)
+        base = dict(template.get("object", {}))
+        base.pop("id", None)
+        gid = base.get("gid")
+        if gid:
+            # Tiles of templates are found in the map by looking for the
+            # external tileset with the same file as the template's.
+            tileset = template.get("tileset", {})
+            source = os.path.abspath(os.path.join(
+                os.path.dirname(fname), tileset.get("source", "")))
+            firstgid = None
+            for map_tileset in tilemap.get("tilesets", []):
+                if (map_tileset.get("source")
+                        and source == os.path.abspath(os.path.join(
+                            tmdir, map_tileset["source"]))):
+                    firstgid = map_tileset.get("firstgid", 1)
+                    break
+
+            if firstgid is not None:
+                rgid, hflip, vflip, dflip = t_gid_parse(gid)
+                base["gid"] = ((rgid - tileset.get("firstgid", 1) + firstgid)
+                               | hflip<<31 | vflip<<30 | dflip<<29)
+            else:
+                del base["gid"]
+        templates[fname] = base
+
+    resolved = dict(base)
+    resolved.update(obj)
+    del resolved["template"]
+    if "properties" in base and "properties" in obj:
+        names = {property_.get("name") for property_ in obj["properties"]}
+        resolved["properties"] = (
+            [property_ for property_ in base["properties"]
+             if property_.get("name") not in names]
+            + obj["properties"])
+    return resolved
+
+
+def _tileset_cache_get(key):
+    # Return the cached value for key, or None if there is none.
+    with _tileset_cache_lock:
+        value = _tileset_cache.get(key)
+        if value is not None:
+            _tileset_cache.move_to_end(key)
+            value = value[0]
+    return value
+
+
+def _tileset_cache_put(key, value, size):
+    # Add value to the tileset cache as taking up size bytes, then
+    # evict the least recently used values until within budget.
+    global _tileset_cache_size
+    if tileset_cache_budget <= 0 or size > tileset_cache_budget:
+        return
+
+    with _tileset_cache_lock:
+        old = _tileset_cache.pop(key, None)
+        if old is not None:
+            _tileset_cache_size -= old[1]
+        _tileset_cache[key] = (value, size)
+        _tileset_cache_size += size
+        while _tileset_cache_size > tileset_cache_budget:
+            old_value, old_size = _tileset_cache.popitem(last=False)[1]
+            _tileset_cache_size -= old_size
+
+
+def _mtime(fname):
+    # Return the modification time of fname for use in cache keys, or
+    # None if it can't be determined.
+    try:
+        return os.stat(fname).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _sprite_size(sprite):
+    # Approximate memory used by sprite, assuming 32-bit pixels.
+    return sprite.width * sprite.height * sprite.frames * 4
 
 
 def t_parse_layer(layer, tilemap, tmdir, tile_cls, tile_sprites, tile_kwargs,
-                  tile_objectalignment, types, z, *, tintcolor=None):
+                  tile_objectalignment, types, z, *, tintcolor=None,
+                  stream_chunks=False, sprite_cache=None, animations=None,
+                  bake_layers=False, shape_sprites=True, profile=None,
+                  templates=None, index=None, wangsets=None):
     """
     Parse a layer and return a tuple containing three values:
 
@@ -388,6 +2665,43 @@ def t_parse_layer(layer, tilemap, tmdir, tile_cls, tile_sprites, tile_kwargs,
     - A list of views retrieved by the layer.
     - The next z index to be used by another layer.
 
+    If ``stream_chunks`` is :const:`True`, the chunks of tile layers are
+    represented by a :class:`ChunkStreamer` object rather than being
+    parsed right away.
+
+    ``sprite_cache`` is a dictionary in which variants of tile sprites
+    are kept by :func:`t_get_sprite_variant`.  Passing the same
+    dictionary for every layer of a map allows variants to be shared
+    between layers.  If set to :const:`None`, a new dictionary is used.
+
+    ``animations`` is the dictionary of :class:`TileAnimation` objects
+    returned by :func:`t_get_tilesets`, or :const:`None` if there are
+    none.
+
+    If ``bake_layers`` is :const:`True`, the objects of tile layers
+    which can be baked (see :func:`t_bake_objects`) are replaced with a
+    :class:`BakedLayer` object.
+
+    ``shape_sprites`` has the same meaning as for :func:`load`.  Shape
+    sprites are kept in ``sprite_cache`` as well.
+
+    If ``profile`` is a :class:`LoadProfile` object, the time spent
+    decoding tile data and creating :class:`sge.gfx.TileGrid` sprites,
+    and the number of tiles put into them, are added to it.
+
+    ``templates`` is a dictionary in which object templates are kept
+    by :func:`t_resolve_template`.  Passing the same dictionary for
+    every layer of a map allows each template to be resolved only
+    once.  If set to :const:`None`, a new dictionary is used.
+
+    If ``index`` is an :class:`ObjectIndex` object, the objects created
+    for the layer are added to it.  It is also given to the
+    :class:`ChunkStreamer` objects of streamed layers.
+
+    ``wangsets`` is a list of :class:`WangSet` objects which the tiles
+    of tile layers are filled in with, or :const:`None`.  See
+    :func:`t_parse_tilechunk` for more information.
+
     This is a low-level function used internally by this library; you
     don't typically need to use it.
 
@@ -396,28 +2710,99 @@ def t_parse_layer(layer, tilemap, tmdir, tile_cls, tile_sprites, tile_kwargs,
        Due to its nature, this function's return value is subject to
        being extended with additional tuple values without notice.
     """
+    return _drain(t_iter_layer(
+        layer, tilemap, tmdir, tile_cls, tile_sprites, tile_kwargs,
+        tile_objectalignment, types, z, tintcolor=tintcolor,
+        stream_chunks=stream_chunks, sprite_cache=sprite_cache,
+        animations=animations, bake_layers=bake_layers,
+        shape_sprites=shape_sprites, profile=profile, templates=templates,
+        index=index, wangsets=wangsets))
+
+
+def t_iter_layer(layer, tilemap, tmdir, tile_cls, tile_sprites, tile_kwargs,
+                 tile_objectalignment, types, z, *, tintcolor=None,
+                 stream_chunks=False, sprite_cache=None, animations=None,
+                 bake_layers=False, shape_sprites=True, profile=None,
+                 templates=None, index=None, wangsets=None):
+    """
+    Return a generator which does the same thing as
+    :func:`t_parse_layer`, but periodically yields the number of tiles
+    and objects it has processed since it last yielded.  The tuple
+    :func:`t_parse_layer` would return is the value of the generator's
+    :exc:`StopIteration`.  This is used by :func:`load_iter`.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
     objects = []
     views = []
 
+    if sprite_cache is None:
+        sprite_cache = {}
+    if templates is None:
+        templates = {}
+
     tintcolor = layer.get("tintcolor", tintcolor)
 
     type_ = layer.get("type")
     if type_ == "group":
-        objects, views, z = t_parse_layer(
-            layer.get("layers", []), tilemap, tmdir, tile_cls, tile_sprites,
-            tile_kwargs, types, z, tintcolor=tintcolor)
+        for sublayer in layer.get("layers", []):
+            new_objects, new_views, z = yield from t_iter_layer(
+                sublayer, tilemap, tmdir, tile_cls, tile_sprites, tile_kwargs,
+                tile_objectalignment, types, z, tintcolor=tintcolor,
+                stream_chunks=stream_chunks, sprite_cache=sprite_cache,
+                animations=animations, bake_layers=bake_layers,
+                shape_sprites=shape_sprites, profile=profile,
+                templates=templates, index=index, wangsets=wangsets)
+            objects.extend(new_objects)
+            views.extend(new_views)
+
+        # The increment below would otherwise skip a z index.
+        z -= 1
     elif type_ == "tilelayer":
         default_cls = types.get(layer.get("name"), Decoration)
         default_kwargs = t_get_properties(layer.get("properties", []))
+        tile_specs = {}
 
-        objects.extend(t_parse_tilechunk(
+        objects.extend((yield from t_iter_tilechunk(
             layer, tilemap, layer, tile_cls, tile_sprites, tile_kwargs,
-            default_cls, default_kwargs, types, z, tintcolor))
-
-        for chunk in layer.get("chunks", []):
-            objects.extend(t_parse_tilechunk(
-                chunk, tilemap, layer, tile_cls, tile_sprites, tile_kwargs,
-                default_cls, default_kwargs, types, z, tintcolor))
+            default_cls, default_kwargs, types, z, tintcolor,
+            sprite_cache=sprite_cache, animations=animations,
+            tile_specs=tile_specs, profile=profile, wangsets=wangsets)))
+
+        chunks = layer.get("chunks", [])
+        if stream_chunks and chunks:
+            objects.append(ChunkStreamer(
+                chunks, tilemap, layer, tile_cls, tile_sprites, tile_kwargs,
+                default_cls, default_kwargs, types, z, tintcolor,
+                sprite_cache=sprite_cache, animations=animations,
+                tile_specs=tile_specs, index=index, wangsets=wangsets))
+        else:
+            for chunk in chunks:
+                objects.extend((yield from t_iter_tilechunk(
+                    chunk, tilemap, layer, tile_cls, tile_sprites,
+                    tile_kwargs, default_cls, default_kwargs, types, z,
+                    tintcolor, sprite_cache=sprite_cache,
+                    animations=animations, tile_specs=tile_specs,
+                    profile=profile, wangsets=wangsets)))
+
+        # Tiles with properties of their own, or in layers with
+        # properties, are left alone so that their keyword arguments
+        # still take effect.
+        if bake_layers and not default_kwargs:
+            sprites = []
+            for value, (cls, kwargs, yadjust) in tile_specs.items():
+                if cls is None or (cls is Decoration
+                                   and not tile_kwargs.get(
+                                       t_gid_parse(value)[0])):
+                    sprites.append(kwargs["sprite"])
+            objects = t_bake_objects(objects, z, animations,
+                                     sprites=sprites)
+
+        if index is not None:
+            for obj in objects:
+                if not isinstance(obj, ChunkStreamer):
+                    index.add(obj, layer.get("name"))
     elif type_ == "objectgroup":
         # Note: unlike the others, we don't fall back to the Decoration
         # class here and instead leave it as None. This is because the
@@ -433,8 +2818,12 @@ def t_parse_layer(layer, tilemap, tmdir, tile_cls, tile_sprites, tile_kwargs,
 
         if layer.get("name") == "views":
             for obj in layer.get("objects", []):
-                x = obj.get("x", 0) + xoffset
-                y = obj.get("y", 0) + yoffset
+                if obj.get("template"):
+                    obj = t_resolve_template(obj, tilemap, tmdir, templates)
+                x, y = t_project_point(tilemap, obj.get("x", 0),
+                                       obj.get("y", 0))
+                x += xoffset
+                y += yoffset
                 kwargs = default_kwargs.copy()
                 kwargs.update(t_get_properties(obj.get("properties", [])))
                 if obj.setdefault("width"):
@@ -443,145 +2832,92 @@ def t_parse_layer(layer, tilemap, tmdir, tile_cls, tile_sprites, tile_kwargs,
                     kwargs["height"] = obj["height"]
 
                 views.append(sge.dsp.View(x, y, **kwargs))
+                yield 1
         else:
-            c = layer.get("color")
-            color = t_get_color(c) if c else None
+            color = layer.get("color")
 
+            # Everything about an object which only depends on its name,
+            # type, tile, and shape is worked out only once for all of
+            # the objects which share them.
+            factories = {}
             for obj in layer.get("objects", []):
-                cls = types.get(obj.get("name"), types.get(obj.get("type")))
-                kwargs = default_kwargs.copy()
-
-                if obj.setdefault("rotation", 0) % 360:
-                    kwargs["image_rotation"] = obj["rotation"]
-
-                x = obj.get("x", 0)
-                y = obj.get("y", 0)
+                yield 1
+                if obj.get("template"):
+                    obj = t_resolve_template(obj, tilemap, tmdir, templates)
+                shape = t_get_object_shape(obj)
+                key = (obj.get("name"), obj.get("type"), obj.get("gid"),
+                       shape)
+                factory = factories.get(key)
+                if factory is None:
+                    factory = t_get_object_factory(
+                        obj, shape, tilemap, tile_cls, tile_sprites,
+                        tile_kwargs, tile_objectalignment, types,
+                        default_cls, default_kwargs, tintcolor,
+                        sprite_cache, animations, profile=profile)
+                    factories[key] = factory
+
+                (cls, kwargs, locked, sprite, xalign, yalign,
+                 visible) = factory
+                kwargs = kwargs.copy()
+
+                x, y = t_project_point(tilemap, obj.get("x", 0),
+                                       obj.get("y", 0))
                 width = obj.get("width", 0)
                 height = obj.get("height", 0)
-                gid = obj.get("gid")
-                if gid:
-                    if cls is None:
-                        cls = tile_cls.get(gid)
-                    kwargs["sprite"] = tile_sprites.get(gid)
-                    if kwargs["sprite"] is not None:
-                        sw = kwargs["sprite"].width
-                        sh = kwargs["sprite"].height
-                        if not width:
-                            width = sw
-                        elif sw and width != sw:
-                            kwargs["image_xscale"] = width / sw
-                        if not height:
-                            height = sh
-                        elif sh and height != sh:
-                            kwargs["image_yscale"] = height / sh
-
-                        if tintcolor:
-                            sprite = kwargs["sprite"].copy()
-                            sprite.draw_rectangle(
-                                0, 0, sprite.width, sprite.height,
-                                fill=t_get_color(tintcolor),
-                                blend_mode=sge.BLEND_RGBA_MULTIPLY)
-                            kwargs["sprite"] = sprite
-
-                    kwargs.update(tile_kwargs.get(gid, {}))
-
-                # We do this here to ensure that non-gid objects get
-                # asigned the default class if no other was picked.  We
-                # do it down here to ensure that layer class doesn't
-                # override gid class or object name/type class.
-                if cls is None:
-                    cls = default_cls
+
+                # Automatically defined kwargs are overridden by the
+                # properties of tiles, which are the locked ones.
+                auto_kwargs = {}
+                if obj.get("rotation", 0) % 360:
+                    auto_kwargs["image_rotation"] = obj["rotation"]
+                if shape == "tile" and sprite is not None:
+                    sw = sprite.width
+                    sh = sprite.height
+                    if not width:
+                        width = sw
+                    elif sw and width != sw:
+                        auto_kwargs["image_xscale"] = width / sw
+                    if not height:
+                        height = sh
+                    elif sh and height != sh:
+                        auto_kwargs["image_yscale"] = height / sh
+                for name in auto_kwargs:
+                    if name not in locked:
+                        kwargs[name] = auto_kwargs[name]
 
                 # We do this after that other stuff to make sure
                 # user-defined kwargs get priority over automatically
                 # defined kwargs above, and priority over user-defined
                 # tile kwargs.
-                kwargs.update(t_get_properties(obj.get("properties", [])))
-
-                if gid:
-                    if cls is None:
-                        cls = Decoration
-
-                    alignment = tile_objectalignment.get(gid)
-                    if alignment == "topleft":
-                        # Nothing to do, that's our native origin
-                        pass
-                    elif alignment == "top":
-                        x -= width / 2
-                    elif alignment == "topright":
-                        x -= width
-                    elif alignment == "left":
-                        y -= height / 2
-                    elif alignment == "center":
-                        x -= width / 2
-                        y -= width / 2
-                    elif alignment == "right":
-                        x -= width
-                        y -= width / 2
-                    elif alignment == "bottomleft":
-                        y -= height
-                    elif alignment == "bottom":
-                        x -= width / 2
-                        y -= height
-                    elif alignment == "bottomright":
-                        x -= width
-                        y -= height
-                    else:
-                        # "Unspecified" alignment
-                        if tilemap["orientation"] != "orthogonal":
-                            x -= width / 2
-                        y -= height
-
-                    objects.append(cls(x + xoffset, y + yoffset, **kwargs))
-                elif obj.get("point"):
-                    if cls is None:
-                        cls = Point
-                    sprite = sge.gfx.Sprite(width=1, height=1)
-                    sprite.draw_rectangle(0, 0, 1, 1, fill=color)
-                    kwargs["sprite"] = sprite
-                    objects.append(cls(x + xoffset, y + yoffset, **kwargs))
-                elif obj.get("ellipse"):
-                    if cls is None:
-                        cls = Ellipse
-                    sprite = sge.gfx.Sprite(width=width, height=height)
-                    sprite.draw_ellipse(0, 0, width, height, fill=color)
-                    kwargs["sprite"] = sprite
-                    objects.append(cls(x + xoffset, y + yoffset, **kwargs))
-                elif obj.setdefault("polygon"):
-                    if cls is None:
-                        cls = Polygon
-                    first_point = obj["polygon"].pop(0)
-                    base_x = first_point.get("x", 0)
-                    base_y = first_point.get("y", 0)
-                    points = []
-                    for point in obj["polygon"]:
-                        px = point.get("x", 0) - base_x
-                        py = point.get("y", 0) - base_y
-                        points.append((px, py))
-                    kwargs["points"] = points
-                    objects.append(cls(x + base_x + xoffset,
-                                       y + base_y + yoffset, **kwargs))
-                elif obj.setdefault("polyline"):
-                    if cls is None:
-                        cls = Polyline
-                    first_point = obj["polyline"].pop(0)
-                    base_x = first_point.get("x", 0)
-                    base_y = first_point.get("y", 0)
-                    points = []
-                    for point in obj["polyline"]:
-                        px = point.get("x", 0) - base_x
-                        py = point.get("y", 0) - base_y
-                        points.append((px, py))
-                    kwargs["points"] = points
-                    objects.append(cls(x + base_x + xoffset,
-                                       y + base_y + yoffset, **kwargs))
+                properties = obj.get("properties")
+                if properties:
+                    kwargs.update(t_get_properties(properties))
+
+                if shape == "tile":
+                    x -= width * xalign
+                    y -= height * yalign
+                elif shape in {"polygon", "polyline"}:
+                    points = t_project_points(tilemap, obj, obj[shape])
+                    x, y = points[0]
+                    kwargs["points"] = [(px - x, py - y)
+                                        for px, py in points[1:]]
                 else:
-                    if cls is None:
-                        cls = Rectangle
-                    sprite = sge.gfx.Sprite(width=width, height=height)
-                    sprite.draw_rectangle(0, 0, width, height, fill=color)
-                    kwargs["sprite"] = sprite
-                    objects.append(cls(x + xoffset, y + yoffset, **kwargs))
+                    if shape == "point":
+                        width = 1
+                        height = 1
+                    if shape_sprites or kwargs.get("visible", visible):
+                        kwargs["sprite"] = t_get_shape_sprite(
+                            shape, width, height, color, sprite_cache,
+                            profile=profile)
+                    else:
+                        kwargs["bbox_width"] = width
+                        kwargs["bbox_height"] = height
+
+                new_obj = cls(x + xoffset, y + yoffset, **kwargs)
+                objects.append(new_obj)
+                if index is not None:
+                    index.add(new_obj, layer.get("name"), obj.get("name"),
+                              obj.get("type"))
     elif type_ == "imagelayer":
         cls = types.get(layer.get("name"), Decoration)
         kwargs = t_get_properties(layer.get("properties", []))
@@ -604,7 +2940,11 @@ def t_parse_layer(layer, tilemap, tmdir, tile_cls, tile_sprites, tile_kwargs,
         else:
             sprite = None
 
-        objects.append(cls(x, y, z, sprite=sprite, **kwargs))
+        new_obj = cls(x, y, sprite=sprite, **kwargs)
+        objects.append(new_obj)
+        if index is not None:
+            index.add(new_obj, layer.get("name"))
+        yield 1
 
     z += 1
     return objects, views, z
@@ -612,144 +2952,622 @@ def t_parse_layer(layer, tilemap, tmdir, tile_cls, tile_sprites, tile_kwargs,
 
 def t_parse_tilechunk(chunk, tilemap, layer, tile_cls, tile_sprites,
                       tile_kwargs, default_cls, default_kwargs, types, z,
-                      tintcolor):
+                      tintcolor, *, sprite_cache=None, animations=None,
+                      tile_specs=None, profile=None, wangsets=None):
     """
     Parse a chunk of a layer and return a list of objects generated.
+    ``sprite_cache``, ``animations``, and ``profile`` have the same
+    meanings as for :func:`t_parse_layer`.
+
+    ``tile_specs`` is a dictionary matching tile values of the layer
+    (GIDs including flip flags) to how they are converted: a tuple of
+    the class, a read-only mapping of keyword arguments, and a vertical
+    offset, or, for tiles which are put into a
+    :class:`sge.gfx.TileGrid`, a class of :const:`None`.  Each tile
+    value is only classified once per dictionary, so passing the same
+    dictionary for all chunks of a layer makes them share the same
+    keyword argument mappings.  Set to :const:`None` to use a new
+    dictionary.
+
+    If ``wangsets`` is a list of :class:`WangSet` objects, the chunk's
+    tiles are filled in with each of them (see :meth:`WangSet.autotile`)
+    before they are parsed, and the filled in tiles replace the chunk's
+    data as an :class:`array.array`.  Each chunk is filled in separately
+    from the others, so it should only be given once for each chunk.
 
     This is a low-level function used internally by this library; you
     don't typically need to use it.
     """
+    return _drain(t_iter_tilechunk(
+        chunk, tilemap, layer, tile_cls, tile_sprites, tile_kwargs,
+        default_cls, default_kwargs, types, z, tintcolor,
+        sprite_cache=sprite_cache, animations=animations,
+        tile_specs=tile_specs, profile=profile, wangsets=wangsets))
+
+
+def t_iter_tilechunk(chunk, tilemap, layer, tile_cls, tile_sprites,
+                     tile_kwargs, default_cls, default_kwargs, types, z,
+                     tintcolor, *, sprite_cache=None, animations=None,
+                     tile_specs=None, profile=None, wangsets=None):
+    """
+    Return a generator which does the same thing as
+    :func:`t_parse_tilechunk`, but periodically yields the number of
+    tiles it has processed since it last yielded.  The list
+    :func:`t_parse_tilechunk` would return is the value of the
+    generator's :exc:`StopIteration`.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    if sprite_cache is None:
+        sprite_cache = {}
+    if tile_specs is None:
+        tile_specs = {}
+
     encoding = layer.get("encoding", "csv")
     compression = layer.get("compression")
+    decode_start = time.perf_counter()
     tiles = t_data_decode(chunk.get("data", []), encoding, compression)
-    tx = chunk.get("x", 0) + layer.get("startx", 0)
-    xoffset = layer.get("offsetx", 0) + tx*tilemap["tilewidth"]
-    ty = chunk.get("y", 0) + layer.get("starty", 0)
-    yoffset = layer.get("offsety", 0) + ty*tilemap["tileheight"]
+    if profile is not None:
+        profile.times["decode"] += time.perf_counter() - decode_start
     width = chunk.get("width", tilemap["width"])
     height = chunk.get("height", tilemap["height"])
+    if wangsets and "data" in chunk:
+        # Data read from the cache is read-only, so the tiles are
+        # filled in on a copy.
+        tiles = array.array("I", tiles)
+        for wangset in wangsets:
+            wangset.autotile(tiles, width, height)
+        chunk["data"] = tiles
+
+    xstep, ystep = t_get_tile_steps(tilemap)
+    tx = chunk.get("x", 0) + layer.get("startx", 0)
+    xoffset = layer.get("offsetx", 0) + tx*xstep
+    ty = chunk.get("y", 0) + layer.get("starty", 0)
+    yoffset = layer.get("offsety", 0) + ty*ystep
 
     orientation = tilemap["orientation"]
     tilewidth = tilemap["tilewidth"]
     tileheight = tilemap["tileheight"]
     staggeraxis = tilemap["staggeraxis"]
-    staggerindex = tilemap["staggerindex"]
-    hexsidelength = tilemap["hexsidelength"]
-
-    can_tile = (orientation != "isometric")
-    if ((orientation == "staggered" and (staggeraxis == "x"
-                                         or staggerindex == "even"))
-            or (orientation == "hexagonal" and staggerindex == "even")):
-        can_tile = False
-
-    tile_grid_tiles = []
-    objects = []
 
-    for i in range(len(tiles)):
-        if tiles[i]:
-            gid, hflip, vflip, dflip = t_gid_parse(tiles[i])
+    isometric = (orientation == "isometric")
+    if isometric:
+        # The offset is set so that the tile in column c and row r of
+        # the chunk is at ((c-r+height-1) * tilewidth/2,
+        # (c+r) * tileheight/2) relative to it, which keeps the left
+        # corner of the chunk's diamond at the offset.
+        xoffset = (layer.get("offsetx", 0)
+                   + (tx - ty + tilemap["height"] - height) * tilewidth/2)
+        yoffset = layer.get("offsety", 0) + (tx+ty) * tileheight/2
+
+    # In staggered and hexagonal maps, this indicates whether the even
+    # rows (or columns) of the chunk are the ones which are shifted,
+    # which depends on both the stagger index and whether the chunk
+    # starts on an even or odd row (or column) of the map.
+    staggered = orientation in {"staggered", "hexagonal"}
+    start = tx if staggeraxis == "x" else ty
+    shift_even = ((tilemap["staggerindex"] == "even") == (start % 2 == 0))
+
+    # Classify each distinct tile value.  Values which can be put into
+    # the TileGrid are mapped to their sprites in ``grid_sprites``,
+    # while those which need objects are mapped to their classes,
+    # keyword arguments, and vertical offsets in ``object_specs``.
+    # Zero (no tile) is in neither.  The keyword arguments are shared
+    # by every object created for the same tile value; they're only
+    # copied into a new dictionary by the call creating each object.
+    # Flags are split from the GIDs here, once per distinct value,
+    # rather than for every tile of the decoded array.
+    grid_sprites = {}
+    object_specs = {}
+    for value in set(tiles):
+        if not value:
+            continue
+
+        spec = tile_specs.get(value)
+        if spec is None:
+            gid, hflip, vflip, dflip = t_gid_parse(value)
             cls = tile_cls.get(gid, default_cls)
             kwargs = default_kwargs.copy()
             kwargs["z"] = z
-            kwargs["sprite"] = tile_sprites.get(gid)
-            if hflip:
-                kwargs["image_xscale"] = -1
-            if vflip:
-                kwargs["image_yscale"] = -1
-            if dflip:
-                kwargs["image_yscale"] = -kwargs.get("image_yscale", 1)
-                kwargs["image_rotation"] = 270
-
-            if tintcolor and kwargs["sprite"]:
-                sprite = kwargs["sprite"].copy()
-                sprite.draw_rectangle(0, 0, sprite.width, sprite.height,
-                                      fill=t_get_color(tintcolor),
-                                      blend_mode=sge.BLEND_RGBA_MULTIPLY)
-                kwargs["sprite"] = sprite
+            kwargs["sprite"] = t_get_sprite_variant(
+                gid, hflip, vflip, dflip, tintcolor, tile_sprites,
+                sprite_cache, animations=animations, profile=profile)
 
-            if (can_tile and cls == Decoration and kwargs["sprite"]
+            yadjust = 0
+            if (cls == Decoration and kwargs["sprite"]
                     and kwargs["sprite"].width == tilewidth
                     and kwargs["sprite"].height == tileheight
-                    and not tile_kwargs.setdefault(gid, {})):
-                if hflip or vflip or dflip:
-                    id_ = (gid, hflip, vflip, dflip)
-                    sprite = tile_sprites.get(id_)
-                    if sprite is None:
-                        sprite = kwargs["sprite"].copy()
-                        if kwargs.get("image_xscale", 1) < 0:
-                            sprite.mirror()
-                        if kwargs.get("image_yscale", 1) < 0:
-                            sprite.flip()
-                        if kwargs.setdefault("image_rotation", 0) % 360:
-                            sprite.rotate(kwargs["image_rotation"])
-                        tile_sprites[id_] = sprite
-                else:
-                    sprite = kwargs["sprite"]
-
-                tile_grid_tiles.append(sprite)
+                    and not tile_kwargs.get(gid)):
+                cls = None
             else:
                 kwargs.update(tile_kwargs.get(gid, {}))
-                column = i % width
-                row = i // width
-                if orientation == "staggered":
-                    x = column * tilewidth
-                    y = row * tileheight
-                    tmeven = (staggerindex == "even")
-                    if staggeraxis == "x":
-                        x /= 2
-                        even = (column % 2 == 0)
-                    else:
-                        y /= 2
-                        even = (row % 2 == 0)
+                if not staggered and kwargs["sprite"] is not None:
+                    yadjust = tileheight - kwargs["sprite"].height
+            spec = (cls, MappingProxyType(kwargs), yadjust)
+            tile_specs[value] = spec
 
-                    if tmeven == even:
-                        y += tileheight / 2
-                elif orientation == "hexagonal":
-                    tmeven = (staggerindex == "even")
-                    if staggeraxis == "x":
-                        x = column * (tilewidth - (tilewidth-hexsidelength)/2)
-                        y = row * tileheight
-                        even = (column % 2 == 0)
-                    else:
-                        x = column * tilewidth
-                        y -= row * (tileheight - (tileheight-hexsidelength)/2)
-                        even = (row % 2 == 0)
+        if spec[0] is None:
+            grid_sprites[value] = spec[1]["sprite"]
+        else:
+            object_specs[value] = spec
 
-                    if tmeven == even:
+    tile_grid_tiles = list(map(grid_sprites.get, tiles))
+    objects = []
+    done = 0
+
+    if object_specs:
+        for i, value in enumerate(tiles):
+            spec = object_specs.get(value)
+            if spec is None:
+                continue
+
+            yield i - done
+            done = i
+
+            cls, kwargs, yadjust = spec
+            column = i % width
+            row = i // width
+            if isometric:
+                x = (column - row + height - 1) * tilewidth / 2
+                y = (column + row) * tileheight / 2
+            else:
+                x = column * xstep
+                y = row * ystep
+            y += yadjust
+            if staggered:
+                if staggeraxis == "x":
+                    if (column % 2 == 0) == shift_even:
                         y += tileheight / 2
+                elif (row % 2 == 0) == shift_even:
+                    x += tilewidth / 2
+
+            objects.append(cls(x + xoffset, y + yoffset, **kwargs))
+
+    if any(tile_grid_tiles):
+        grid_start = time.perf_counter()
+
+        if staggered or isometric:
+            # The "isometric", "isohex", and "hexagonal" render methods
+            # don't draw correctly once the view scrolls in the versions
+            # of the SGE this library supports, so instead the rows (or
+            # columns) of each parity are put into an orthogonal grid of
+            # their own whose cells are two rows (or columns) apart.  In
+            # isometric maps, these are the rows of the diamond.
+            if isometric:
+                cell_width = tilewidth
+                cell_height = tileheight
+            elif staggeraxis == "x":
+                cell_width = int(2 * xstep)
+                cell_height = tileheight
+            else:
+                cell_width = tilewidth
+                cell_height = int(2 * ystep)
+
+            groups = [{}, {}]
+            for i, sprite in enumerate(tile_grid_tiles):
+                if sprite is not None:
+                    column = i % width
+                    row = i // width
+                    if isometric:
+                        # Tiles in the same row of the diamond are a
+                        # whole tile apart, so dividing the horizontal
+                        # position in half tiles by two is exact.
+                        groups[(column+row) % 2][(
+                            (column - row + height - 1) // 2,
+                            (column + row) // 2)] = sprite
+                    elif staggeraxis == "x":
+                        groups[column % 2][(column // 2, row)] = sprite
+                    else:
+                        groups[row % 2][(column, row // 2)] = sprite
+
+            grids = []
+            for parity, group in enumerate(groups):
+                if not group:
+                    continue
+
+                shifted = ((parity == 0) == shift_even)
+                if isometric:
+                    x = (parity + height - 1) % 2 * tilewidth/2
+                    y = parity * tileheight/2
+                elif staggeraxis == "x":
+                    x = parity * xstep
+                    y = tileheight/2 if shifted else 0
                 else:
-                    x = column * tilewidth
-                    y = row * tileheight
-                    if kwargs["sprite"] is not None:
-                        y += tileheight - kwargs["sprite"].height
+                    x = tilewidth/2 if shifted else 0
+                    y = parity * ystep
+
+                section_length = max(column for column, row in group) + 1
+                rows = max(row for column, row in group) + 1
+                group_tiles = [None] * (section_length*rows)
+                for (column, row), sprite in group.items():
+                    group_tiles[row*section_length + column] = sprite
+                grids.append((xoffset + x, yoffset + y, section_length,
+                              cell_width, cell_height, group_tiles))
+        else:
+            grids = [(xoffset, yoffset, width, tilewidth, tileheight,
+                      tile_grid_tiles)]
+
+        for (x, y, section_length, cell_width, cell_height,
+             grid_tiles) in grids:
+            tile_grid = sge.gfx.TileGrid(grid_tiles, "orthogonal",
+                                         section_length, cell_width,
+                                         cell_height)
+            objects.append(Decoration(x, y, z, sprite=tile_grid))
+
+        if profile is not None:
+            profile.times["tilegrids"] += time.perf_counter() - grid_start
+            profile.grid_tiles += (len(tile_grid_tiles)
+                                   - tile_grid_tiles.count(None))
+
+    yield len(tiles) - done
+    return objects
+
+
+def t_bake_objects(objects, z, animations=None, *, sprites=None):
+    """
+    Return a copy of the list of objects ``objects`` in which the
+    objects that can be baked into a :class:`BakedLayer` are replaced
+    with one such object with Z-axis position ``z``.  Objects that can
+    be baked are visible, intangible objects of exactly the
+    :class:`Decoration` class which don't check for collisions, whose
+    ``image_*`` attributes other than the origin have their default
+    values, and whose sprites are not the sprites of animations in the
+    dictionary ``animations``.  If ``sprites`` is not :const:`None`,
+    only objects whose sprites are in it (by identity) are baked.  The
+    tiles of :class:`sge.gfx.TileGrid`
+    sprites are baked separately; if some of them can't be baked, the
+    object is kept with a new :class:`sge.gfx.TileGrid` containing
+    only those tiles.
 
-                obj = cls(x + xoffset, y + yoffset, **kwargs)
-                objects.append(obj)
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    # The IDs of sprites which must not be baked.
+    kept = set()
+    for animation in (animations or {}).values():
+        kept.add(id(animation.sprite))
+        kept.update(id(variant.sprite) for variant in animation.variants)
+
+    allowed = None
+    if sprites is not None:
+        allowed = {id(sprite) for sprite in sprites}
+
+    def can_bake(sprite):
+        return (id(sprite) not in kept
+                and (allowed is None or id(sprite) in allowed))
+
+    parts = []
+    unbaked = []
+    for obj in objects:
+        if (type(obj) is not Decoration or not obj.visible
+                or obj.sprite is None or obj.tangible
+                or obj.checks_collisions or obj.image_index
+                or obj.image_xscale != 1 or obj.image_yscale != 1
+                or obj.image_rotation or obj.image_alpha != 255
+                or obj.image_blend is not None
+                or obj.image_blend_mode is not None):
+            unbaked.append(obj)
+            continue
+
+        for part in t_get_sprite_parts(obj):
+            if can_bake(part[2]):
+                parts.append(part)
+
+        grid = obj.sprite
+        if isinstance(grid, sge.gfx.TileGrid):
+            tiles = [sprite if sprite is not None and not can_bake(sprite)
+                     else None for sprite in grid.tiles]
+            if any(tiles):
+                obj.sprite = sge.gfx.TileGrid(
+                    tiles, grid.render_method, grid.section_length,
+                    grid.tile_width, grid.tile_height, grid.meta)
+                unbaked.append(obj)
+        elif not can_bake(grid):
+            unbaked.append(obj)
+
+    if parts:
+        unbaked.append(BakedLayer(parts, z))
+    return unbaked
+
+
+def t_get_sprite_parts(obj):
+    """
+    Return a list of ``(x, y, sprite)`` tuples indicating the sprites
+    which make up what is drawn by the object ``obj``, and where they
+    are drawn in the room.  This is ``obj``'s sprite, unless the sprite
+    is a :class:`sge.gfx.TileGrid`, in which case it is the sprites of
+    each of its tiles.
 
-                tile_grid_tiles.append(None)
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    grid = obj.sprite
+    if not isinstance(grid, sge.gfx.TileGrid):
+        return [(obj.x - grid.origin_x, obj.y - grid.origin_y, grid)]
+
+    parts = []
+    w = grid.tile_width
+    h = grid.tile_height
+    for i, sprite in enumerate(grid.tiles):
+        if sprite is None:
+            continue
+
+        column = i % grid.section_length
+        row = i // grid.section_length
+        if grid.render_method == "isometric":
+            x = column*w + (w/2 if row % 2 else 0)
+            y = row * h / 2
+        elif grid.render_method == "hexagonal":
+            x = column * (w-grid.meta)
+            y = row*h + (h/2 if column % 2 else 0)
+        elif grid.render_method == "isohex":
+            x = column*w + (w/2 if row % 2 else 0)
+            y = row * (h-grid.meta)
         else:
-            tile_grid_tiles.append(None)
+            x = column * w
+            y = row * h
+        parts.append((obj.x + x - sprite.origin_x, obj.y + y - sprite.origin_y,
+                      sprite))
+    return parts
 
-    if any(tile_grid_tiles):
-        meta = 0
-        if orientation == "staggered":
-            render_method = "isometric"
-        elif orientation == "hexagonal":
-            if staggeraxis == "x":
-                render_method = "hexagonal"
-                meta = (tilewidth-hexsidelength) / 2
-            else:
-                render_method = "isohex"
-                meta = (tileheight-hexsidelength) / 2
+
+def t_project_point(tilemap, x, y):
+    """
+    Return a tuple containing the position in the room of the point
+    at position (``x``, ``y``) in the coordinates used by objects in
+    ``tilemap``.  This is the same point, except in isometric maps,
+    where objects are positioned in a coordinate space aligned with the
+    tile grid.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    if tilemap["orientation"] == "isometric":
+        half_width = tilemap["tilewidth"] / 2
+        tileheight = tilemap["tileheight"]
+        return ((x-y) / tileheight * half_width
+                + tilemap["height"] * half_width,
+                (x+y) / 2)
+    else:
+        return x, y
+
+
+def t_project_points(tilemap, obj, points):
+    """
+    Return a list of the positions in the room of the points of the
+    polygon or polyline ``points`` of the object ``obj`` as projected by
+    :func:`t_project_point`.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    x = obj.get("x", 0)
+    y = obj.get("y", 0)
+    return [t_project_point(tilemap, x + point.get("x", 0),
+                            y + point.get("y", 0))
+            for point in points]
+
+
+def t_get_tile_steps(tilemap):
+    """
+    Return a tuple containing the horizontal distance between the
+    columns and the vertical distance between the rows of tiles in
+    ``tilemap``, not counting the shift of staggered rows or columns.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    tilewidth = tilemap["tilewidth"]
+    tileheight = tilemap["tileheight"]
+    orientation = tilemap["orientation"]
+    if orientation == "staggered":
+        if tilemap["staggeraxis"] == "x":
+            return tilewidth / 2, tileheight
+        else:
+            return tilewidth, tileheight / 2
+    elif orientation == "hexagonal":
+        hexsidelength = tilemap["hexsidelength"]
+        if tilemap["staggeraxis"] == "x":
+            return (tilewidth+hexsidelength) / 2, tileheight
         else:
-            render_method = "orthogonal"
+            return tilewidth, (tileheight+hexsidelength) / 2
+    else:
+        return tilewidth, tileheight
 
-        tile_grid = sge.gfx.TileGrid(
-            tile_grid_tiles, render_method, width, tilemap["tilewidth"],
-            tilemap["tileheight"], meta)
-        objects.append(Decoration(xoffset, yoffset, z, sprite=tile_grid))
 
-    return objects
+def t_get_sprite_variant(gid, hflip, vflip, dflip, tintcolor, tile_sprites,
+                         sprite_cache, *, animations=None, profile=None):
+    """
+    Return the sprite of the tile indicated by Tiled GID ``gid`` (with
+    flip flags removed) from ``tile_sprites``, with the indicated flips
+    applied and tinted with ``tintcolor`` (a Tiled color string, or
+    :const:`None` for no tint).  Each variant is only created once and
+    then kept in the dictionary ``sprite_cache``.
+
+    Flips are applied to the sprite itself, rather than being left to
+    :attr:`sge.dsp.Object.image_xscale` and friends, so that they don't
+    need to be done again every time the sprite is drawn.
+
+    If ``gid`` is in ``animations``, a dictionary of
+    :class:`TileAnimation` objects, the variant is the sprite of a
+    variant of the animation (see :meth:`TileAnimation.get_variant`).
+
+    If ``profile`` is a :class:`LoadProfile` object, the number of
+    sprites created is added to its :attr:`LoadProfile.sprites`.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    key = (gid, hflip, vflip, dflip, tintcolor)
+    try:
+        return sprite_cache[key]
+    except KeyError:
+        pass
+
+    sprite = tile_sprites.get(gid)
+    if sprite is not None and (hflip or vflip or dflip or tintcolor):
+        if animations and gid in animations:
+            variant = animations[gid].get_variant(hflip, vflip, dflip,
+                                                  tintcolor)
+            sprite = variant.sprite
+            created = len(variant.frames) + 1
+        else:
+            sprite = t_transform_sprite(sprite, hflip, vflip, dflip,
+                                        tintcolor)
+            created = 1
+        if profile is not None:
+            profile.sprites += created
+
+    sprite_cache[key] = sprite
+    return sprite
+
+
+def t_transform_sprite(sprite, hflip, vflip, dflip, tintcolor):
+    """
+    Return a copy of ``sprite`` with the indicated flips applied and
+    tinted with ``tintcolor`` (a Tiled color string, or :const:`None`
+    for no tint).
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    sprite = sprite.copy()
+    if tintcolor:
+        sprite.draw_rectangle(0, 0, sprite.width, sprite.height,
+                              fill=t_get_color(tintcolor),
+                              blend_mode=sge.BLEND_RGBA_MULTIPLY)
+    if hflip:
+        sprite.mirror()
+    if vflip != dflip:
+        sprite.flip()
+    if dflip:
+        sprite.rotate(270)
+
+    return sprite
+
+
+def t_get_object_shape(obj):
+    """
+    Return the shape of the Tiled object ``obj``: one of ``"tile"``,
+    ``"point"``, ``"ellipse"``, ``"polygon"``, ``"polyline"``, or
+    ``"rectangle"``.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    if obj.get("gid"):
+        return "tile"
+    for shape in ["point", "ellipse", "polygon", "polyline"]:
+        if obj.get(shape):
+            return shape
+    return "rectangle"
+
+
+def t_get_object_factory(obj, shape, tilemap, tile_cls, tile_sprites,
+                         tile_kwargs, tile_objectalignment, types,
+                         default_cls, default_kwargs, tintcolor,
+                         sprite_cache, animations, *, profile=None):
+    """
+    Return a tuple containing everything needed to create the Tiled
+    object ``obj``, of the shape ``shape`` (see
+    :func:`t_get_object_shape`), which only depends on its name, type,
+    tile, and shape, so that it can be reused for every object which
+    shares these.  The tuple contains the following:
+
+    - The class of the object.
+    - A dictionary of keyword arguments to pass to the class, which
+      are the default keyword arguments ``default_kwargs`` overridden
+      by the sprite and properties of the object's tile.
+    - A set of the keyword arguments which come from the properties of
+      the object's tile, and so must not be overridden by those worked
+      out from the object.
+    - The sprite of the object's tile, or :const:`None`.
+    - The fractions of the object's width and height by which the
+      object's position must be moved left and up, respectively, to
+      account for the tile's object alignment.
+    - Whether or not the object is visible by default, which is the
+      default value of the class's ``visible`` argument if it has one,
+      or :const:`True` otherwise.
+
+    Other arguments are the same as for :func:`t_parse_layer`.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    cls = types.get(obj.get("name"), types.get(obj.get("type")))
+    kwargs = default_kwargs.copy()
+    locked = set()
+    sprite = None
+    xalign = 0
+    yalign = 0
+
+    if shape == "tile":
+        gid, hflip, vflip, dflip = t_gid_parse(obj["gid"])
+        if cls is None:
+            cls = tile_cls.get(gid)
+        sprite = t_get_sprite_variant(gid, hflip, vflip, dflip, tintcolor,
+                                      tile_sprites, sprite_cache,
+                                      animations=animations, profile=profile)
+        kwargs["sprite"] = sprite
+        kwargs.update(tile_kwargs.get(gid, {}))
+        locked.update(tile_kwargs.get(gid, {}))
+
+        alignment = tile_objectalignment.get(gid)
+        if alignment in _ALIGNMENTS:
+            xalign, yalign = _ALIGNMENTS[alignment]
+        else:
+            # "Unspecified" alignment
+            if tilemap["orientation"] != "orthogonal":
+                xalign = 0.5
+            yalign = 1
+
+    # We do this here to ensure that layer class doesn't override gid
+    # class or object name/type class.
+    if cls is None:
+        cls = default_cls
+    if cls is None:
+        cls = {"tile": Decoration, "point": Point, "ellipse": Ellipse,
+               "polygon": Polygon, "polyline": Polyline,
+               "rectangle": Rectangle}[shape]
+
+    try:
+        visible = inspect.signature(cls).parameters["visible"].default
+    except (KeyError, TypeError, ValueError):
+        visible = True
+    if visible is inspect.Parameter.empty:
+        visible = True
+
+    return cls, kwargs, locked, sprite, xalign, yalign, visible
+
+
+def t_get_shape_sprite(shape, width, height, color, sprite_cache, *,
+                       profile=None):
+    """
+    Return a sprite showing the shape ``shape`` (``"point"``,
+    ``"ellipse"``, or ``"rectangle"``) with the indicated size, filled
+    with ``color`` (a Tiled color string, or :const:`None`).  Each such
+    sprite is only created once and then kept in the dictionary
+    ``sprite_cache``.  If ``profile`` is a :class:`LoadProfile` object,
+    the sprite is counted by its :attr:`LoadProfile.sprites` when it is
+    created.
+
+    This is a low-level function used internally by this library; you
+    don't typically need to use it.
+    """
+    key = (shape, width, height, color)
+    sprite = sprite_cache.get(key)
+    if sprite is None:
+        fill = t_get_color(color) if color else None
+        sprite = sge.gfx.Sprite(width=width, height=height)
+        if shape == "ellipse":
+            sprite.draw_ellipse(0, 0, width, height, fill=fill)
+        else:
+            sprite.draw_rectangle(0, 0, width, height, fill=fill)
+        sprite_cache[key] = sprite
+        if profile is not None:
+            profile.sprites += 1
+    return sprite
 
 
 def t_get_properties(properties):
@@ -813,7 +3631,10 @@ def t_get_color(value):
 
 def t_data_decode(data, encoding, compression):
     """
-    Decode encoded data and return a list of integers it represents.
+    Decode encoded data and return a sequence of integers it
+    represents.  Encoded data is returned as an :class:`array.array`,
+    which is decoded directly from the underlying bytes rather than
+    one integer at a time.
 
     Arguments:
 
@@ -821,7 +3642,7 @@ def t_data_decode(data, encoding, compression):
     - ``encoding`` -- The encoding of the data.  Can be ``"base64"``
       or ``"csv"``.
     - ``compression`` -- The compression method used.  Valid
-      compression methods are ``"gzip"`` and ``"zlib"``.
+      compression methods are ``"gzip"``, ``"zlib"``, and ``"zstd"``.
       Set to ``None`` for no compression.
 
     This is a low-level function used internally by this library; you
@@ -829,7 +3650,7 @@ def t_data_decode(data, encoding, compression):
     """
     if isinstance(data, str):
         if encoding == "csv":
-            return [int(i) for i in data.strip().split(",")]
+            return array.array("I", map(int, data.strip().split(",")))
         elif encoding == "base64":
             data = base64.b64decode(data.strip().encode("latin1"))
 
@@ -837,19 +3658,30 @@ def t_data_decode(data, encoding, compression):
                 data = gzip.decompress(data)
             elif compression == "zlib":
                 data = zlib.decompress(data)
+            elif compression == "zstd":
+                if zstd is not None:
+                    data = zstd.decompress(data)
+                elif zstandard is not None:
+                    # Decompressors aren't thread-safe, and only
+                    # decompression objects support frames which don't
+                    # record their content size, so a new one is used
+                    # every time.
+                    decompressor = zstandard.ZstdDecompressor()
+                    data = decompressor.decompressobj().decompress(data)
+                else:
+                    raise ValueError(
+                        "zstd compression requires Python 3.14 or later, or "
+                        "the zstandard library.")
             elif compression:
                 e = 'Compression type "{}" not supported.'.format(compression)
                 raise ValueError(e)
 
-            ndata = [i for i in data]
-
-            data = []
-            for i in range(0, len(ndata), 4):
-                n = (ndata[i]  + ndata[i+1] * (2**8)
-                     + ndata[i+2] * (2**16) + ndata[i+3] * (2**24))
-                data.append(n)
+            tiles = array.array("I")
+            tiles.frombytes(data)
+            if sys.byteorder != "little":
+                tiles.byteswap()
 
-            return data
+            return tiles
         else:
             e = 'Encoding type "{}" not supported.'.format(encoding)
             raise ValueError(e)